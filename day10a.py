@@ -1,10 +1,13 @@
+from collections import Counter
+
 
 def main():
     # load adapter jolt ratings from the input file
     with open('input/day10.txt') as f:
         adapter_ratings = [
-            int(line)
-            for line in f
+            int(word)
+            # read the whole file in one go, and split it up on whitespace
+            for word in f.read().split()
         ]
 
     # an adapter can tolerate values slightly lower than its rated output
@@ -27,20 +30,18 @@ def main():
         device_charging_joltage,
     ]
 
-    # we'll keep track of how many times we've seen each value of differences
-    differences = {}
-    # go through each rating pair-wise
-    for prev_value, value in zip(sorted_ratings[:-1], sorted_ratings[1:]):
+    # count how many times we see each difference between neighbouring ratings
+    # (a Counter is a dictionary that does the counting for us, and it does it in fast C code rather than Python)
+    differences = Counter(
         # calculate the difference
-        difference = value - prev_value
-        # get the current count or default it to 0
-        count = differences.setdefault(difference, 0)
-        # update the count
-        differences[difference] = count + 1
-
-    # get the differences we've been asked for, defaulting to 0 if they're missing
-    one_jolt_differences = differences.get(1, 0)
-    three_jolt_differences = differences.get(3, 0)
+        value - prev_value
+        # for each rating pair-wise
+        for prev_value, value in zip(sorted_ratings, sorted_ratings[1:])
+    )
+
+    # get the differences we've been asked for, missing values in a Counter are always 0
+    one_jolt_differences = differences[1]
+    three_jolt_differences = differences[3]
 
     print("1-jolt differences ({}) x 3-jolt differences ({}) = {}".format(
         one_jolt_differences,
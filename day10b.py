@@ -1,43 +1,39 @@
-from typing import Dict, List, Optional, Iterable
+from typing import List
 
 
-def ways_to_combine_adapters_after(possibilities: Dict[int, List[int]], value: int,
-                                   cache: Optional[Dict[int, int]] = None) -> int:
-    """work out how many adapter arrangements are after the specified adapter"""
+def ways_to_combine_adapters(sorted_ratings: List[int], max_tolerance: int) -> int:
+    """work out how many adapter arrangements connect the first rating to the last rating"""
 
-    # if we don't have somewhere to remember our answers, make somewhere, this code is slow
-    if cache is None:
-        cache = {}
+    rating_count = len(sorted_ratings)
+    # ways[idx] records how many arrangements there are from the adapter at idx to the end of the chain
+    ways = [0] * rating_count
+    # the last rating (the device) is the end of the chain, so there's only one "arrangement" from there
+    ways[-1] = 1
 
-    # have we worked out the answer before?
-    result = cache.get(value)
-    # if so, return it now
-    if result is not None:
-        return result
+    # work backwards through the ratings, so that by the time we look at an adapter we already know
+    # the answer for every adapter it could connect to (they all come after it in the sorted list!)
+    for idx in range(rating_count - 2, -1, -1):
+        value = sorted_ratings[idx]
+        # the number of ways from here is the sum of the ways from each adapter we could connect to
+        total = 0
+        next_idx = idx + 1
+        # because the ratings are sorted, we can stop looking as soon as we find one that's too far away,
+        # as every rating after that is even further away!
+        while next_idx < rating_count and sorted_ratings[next_idx] - value <= max_tolerance:
+            total += ways[next_idx]
+            next_idx += 1
+        ways[idx] = total
 
-    # how many things can this adapter connect to?
-    can_connect_to = possibilities[value]
-    # if it can't connect to anything then there's only one "arrangement" of this adapter
-    if not can_connect_to:
-        return 1
-
-    # otherwise, sum up the possible ways to arrange all the adapters we can choose from
-    result = sum(
-        ways_to_combine_adapters_after(possibilities, v, cache)
-        for v in can_connect_to
-    )
-    # remember the result so we don't work it out again in future!
-    cache[value] = result
-
-    return result
+    return ways[0]
 
 
 def main():
     # load adapter jolt ratings from the input file
     with open('input/day10.txt') as f:
         adapter_ratings = [
-            int(line)
-            for line in f
+            int(word)
+            # read the whole file in one go, and split it up on whitespace
+            for word in f.read().split()
         ]
 
     # an adapter can tolerate values slightly lower than its rated output
@@ -60,20 +56,7 @@ def main():
         device_charging_joltage,
     ]
 
-    # record the possible choices exist at each step
-    possibilities = {}
-    # go through each rating
-    for idx, value in enumerate(sorted_ratings):
-        branches = []
-        # how many different adapters could we connect to?
-        for next_value in sorted_ratings[idx+1:]:
-            if next_value - value <= max_tolerance:
-                branches.append(next_value)
-
-        # remember what adapters this adapter could connect to
-        possibilities[value] = branches
-
-    combinations = ways_to_combine_adapters_after(possibilities, effective_charger_outlet_joltage)
+    combinations = ways_to_combine_adapters(sorted_ratings, max_tolerance)
     print(f"there are {combinations} distinct ways to arrange the adapters")
 
 
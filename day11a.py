@@ -1,4 +1,4 @@
-from typing import List, IO, Optional, Dict, Tuple
+from typing import IO, Optional
 from dataclasses import dataclass
 import pygame
 import enum
@@ -13,30 +13,50 @@ class SeatState(enum.Enum):
     Occupied = enum.auto()
 
 
-def parse_seat_state(state: str) -> SeatState:
-    """decode text representation of seat state"""
+# how each letter in the input maps to a seat state
+SEAT_STATE_MAP = {
+    '.': SeatState.Floor,
+    'L': SeatState.Empty,
+    '#': SeatState.Occupied,
+}
 
-    seat_state_map = {
-        '.': SeatState.Floor,
-        'L': SeatState.Empty,
-        '#': SeatState.Occupied,
-    }
+# translation tables for turning a whole line of input into a string of 1s and 0s in one go, marking which positions
+# have a seat in them, and which positions have an occupied seat in them
+SEAT_BITS_TRANSLATION = str.maketrans('.L#', '011')
+OCCUPIED_BITS_TRANSLATION = str.maketrans('.L#', '001')
 
-    return seat_state_map[state]
+# all the possible offsets from the current position that represents an "adjacent" position
+NEIGHBOUR_OFFSETS = (
+    (-1, -1), (+0, -1), (+1, -1),
+    (-1, +0),           (+1, +0),
+    (-1, +1), (+0, +1), (+1, +1),
+)
 
 
 @dataclass
 class SeatingPlan:
-    """the state of all seats"""
+    """
+    the state of all seats
+
+    the seats are stored as "bitboards", big numbers where each bit is one position in the grid, so that python can
+    work on every position at once with a single bitwise operation (&, |, ^, ~, << and >>)
+
+    each row has one extra bit on the end that is always 0, so that looking left or right off the edge of a row
+    sees that spare bit, rather than wrapping around onto the start of the next row
+    """
 
-    seats: List[SeatState]
+    # bits set for every position that has a seat in it (empty or occupied), the floor never changes
+    seats: int
+    # bits set for every position that has an occupied seat in it
+    occupied: int
     width: int
+    height: int
 
     @property
-    def height(self) -> int:
-        """how many rows of seats there are"""
+    def stride(self) -> int:
+        """how many bits each row takes up, including the spare bit on the end"""
 
-        return int(len(self.seats) / self.width)
+        return self.width + 1
 
     def get(self, x: int, y: int) -> Optional[SeatState]:
         """get the state of a particular seat, returns None if invalid coordinate"""
@@ -45,52 +65,34 @@ class SeatingPlan:
         if x < 0 or y < 0 or x >= self.width or y >= self.height:
             return None
 
-        # get the seat
-        index = self._index(x, y)
-        return self.seats[index]
-
-    def set(self, x: int, y: int, value: SeatState):
-        """update the state of a particular seat"""
-
-        index = self._index(x, y)
-        self.seats[index] = value
-
-    def neighbours_of(self, x: int, y: int) -> Dict[Tuple[int, int], Optional[SeatState]]:
-        """get the state of all seats adjacent to the specified seat"""
-
-        # all the possible offsets from the current position that represents an "adjacent" position
-        offsets = [
-            (-1, -1), (+0, -1), (+1, -1),
-            (-1, +0),           (+1, +0),
-            (-1, +1), (+0, +1), (+1, +1),
-        ]
-
-        # build a dictionary
-        return {
-            # map the offset coordinates to the contents of the seating plan at that position (may be off the grid!)
-            (offset_x, offset_y): self.get(x + offset_x, y + offset_y)
-            # for every adjacent position
-            for offset_x, offset_y in offsets
-        }
+        # look at the bit for this position in each bitboard
+        bit = 1 << self._index(x, y)
+        if self.occupied & bit:
+            return SeatState.Occupied
+        if self.seats & bit:
+            return SeatState.Empty
+        return SeatState.Floor
 
     def clone(self) -> 'SeatingPlan':
         """creates a separate copy of the seating plan"""
 
         return SeatingPlan(
-            seats=self.seats[:],
+            seats=self.seats,
+            occupied=self.occupied,
             width=self.width,
+            height=self.height,
         )
 
     def _index(self, x: int, y: int) -> int:
-        """calculate the index into our list of seats based on the seating coordinate"""
+        """calculate which bit of the bitboards represents the seating coordinate"""
 
-        return y * self.width + x
+        return y * self.stride + x
 
 
 def load_seating_plan(f: IO) -> SeatingPlan:
     """decode seating plan from an input stream"""
 
-    seats = []
+    rows = []
 
     line_width: Optional[int] = None
     for line in f:
@@ -106,55 +108,73 @@ def load_seating_plan(f: IO) -> SeatingPlan:
         elif line_width != len(line):
             raise Exception(f"inconsistent line length in input ({line_width} so far vs {len(line)} in this line)")
 
-        # store all the decoded seats from this line of input
-        seats.extend([
-            parse_seat_state(letter)
-            for letter in line
-        ])
+        # check that we recognise every letter in the line
+        unknown_letters = set(line) - SEAT_STATE_MAP.keys()
+        if unknown_letters:
+            raise Exception(f"unknown seat states in input: {unknown_letters}")
+
+        # store the line of input, we can't decode it until we know how many rows there are
+        rows.append(line)
 
     if not line_width:
         raise Exception("no lines read from input!")
 
-    return SeatingPlan(
-        seats=seats,
+    plan = SeatingPlan(
+        seats=0,
+        occupied=0,
         width=line_width,
+        height=len(rows),
     )
+    for y, row in enumerate(rows):
+        # turn the row into 1s and 0s, then reverse it so that the first position in the row is the lowest bit,
+        # and let python read it as a binary number, which we then move into this row's place in the bitboard
+        row_offset = plan.stride * y
+        plan.seats |= int(row[::-1].translate(SEAT_BITS_TRANSLATION), 2) << row_offset
+        plan.occupied |= int(row[::-1].translate(OCCUPIED_BITS_TRANSLATION), 2) << row_offset
+
+    return plan
+
+
+def count_bits(value: int) -> int:
+    """count how many bits are set in a number"""
+
+    return bin(value).count('1')
 
 
 def update_seating_plan(plan: SeatingPlan) -> SeatingPlan:
     """apply the rules from the puzzle to the seating plan, producing a new seating plan"""
 
-    # start with a fresh copy to mutate
+    # count the number of occupied adjacent seats for every position at once
+    #
+    # the count for each position can go up to 8, so we store it as a 4-bit binary number spread over
+    # 4 bitboards: counts[0] holds the 1s bit of every position's count, counts[1] the 2s bit, etc.
+    counts = [0, 0, 0, 0]
+    for offset_x, offset_y in NEIGHBOUR_OFFSETS:
+        # shift the occupied seats so that each position's bit now says whether its neighbour is occupied
+        shift = offset_y * plan.stride + offset_x
+        if shift > 0:
+            neighbour_occupied = plan.occupied >> shift
+        else:
+            neighbour_occupied = plan.occupied << -shift
+
+        # add 1 to the count of every position with an occupied neighbour, doing the carries like long addition
+        carry = neighbour_occupied
+        for bit_index in range(len(counts)):
+            counts[bit_index], carry = counts[bit_index] ^ carry, counts[bit_index] & carry
+
+    # apply the rules to every seat at once
+    no_occupied_neighbours = ~(counts[0] | counts[1] | counts[2] | counts[3])
+    # a count of 4 or more has either the 4s or 8s bit set
+    four_or_more_occupied_neighbours = counts[2] | counts[3]
+
+    empty = plan.seats & ~plan.occupied
     next_plan = plan.clone()
-
-    # evaluate the rules for every position in the grid
-    for y in range(plan.height):
-        for x in range(plan.width):
-            current_state = plan.get(x, y)
-            # there are only rules for empty or occupied seats, so skip everything else
-            if current_state not in (SeatState.Empty, SeatState.Occupied):
-                continue
-
-            # count the number of occupied adjacent seats
-            neighbours = plan.neighbours_of(x, y)
-            number_of_occupied_neighbours = sum(
-                1
-                for seat in neighbours.values()
-                if seat == SeatState.Occupied
-            )
-
-            # by default the next state will be the same as the current state, unless a rule overrides it
-            next_state = current_state
-
-            # apply the rules to this seat
-            if current_state == SeatState.Empty and number_of_occupied_neighbours == 0:
-                next_state = SeatState.Occupied
-            elif current_state == SeatState.Occupied and number_of_occupied_neighbours >= 4:
-                next_state = SeatState.Empty
-
-            # if the seat state has changed, record the change
-            if next_state != current_state:
-                next_plan.set(x, y, next_state)
+    next_plan.occupied = (
+        # empty seats with no occupied neighbours become occupied
+        (empty & no_occupied_neighbours)
+        # occupied seats stay occupied, unless they have 4 or more occupied neighbours
+        | (plan.occupied & ~four_or_more_occupied_neighbours)
+    )
 
     return next_plan
 
@@ -162,12 +182,8 @@ def update_seating_plan(plan: SeatingPlan) -> SeatingPlan:
 def count_differences(a: SeatingPlan, b: SeatingPlan) -> int:
     """count how many seats have a different state between two seating plans"""
 
-    return sum(
-        # yield a 1 if the seats are different, otherwise a 0
-        1 if seat_a != seat_b else 0
-        # when comparing each corresponding seat in the two seating plans
-        for seat_a, seat_b in zip(a.seats, b.seats)
-    )
+    # only the occupied seats ever change, and xor sets a bit everywhere that the two are different
+    return count_bits(a.occupied ^ b.occupied)
 
 
 def main():
@@ -258,11 +274,7 @@ def main():
         pygame.display.flip()
 
     # count how many seats were occupied
-    occupied_seats = sum(
-        1
-        for seat in seating_plan.seats
-        if seat == SeatState.Occupied
-    )
+    occupied_seats = count_bits(seating_plan.occupied)
     print(f"{occupied_seats} occupied seats when equilibrium reached")
 
 
@@ -1,115 +1,174 @@
-from typing import List, IO, Optional, Dict, Tuple
+from typing import IO, Optional, Tuple
 from dataclasses import dataclass
+import numpy as np
 import pygame
-import enum
 
 
-@enum.unique
-class SeatState(enum.Enum):
-    """whether a grid of the map is floor, an empty seat or an occupied seat"""
-
-    Floor = enum.auto()
-    Empty = enum.auto()
-    Occupied = enum.auto()
-
-
-def parse_seat_state(state: str) -> SeatState:
-    """decode text representation of seat state"""
-
-    seat_state_map = {
-        '.': SeatState.Floor,
-        'L': SeatState.Empty,
-        '#': SeatState.Occupied,
-    }
-
-    return seat_state_map[state]
+# whether a grid of the map is floor, an empty seat or an occupied seat
+#
+# these are plain numbers (rather than an enum) so that a whole seating plan can be stored as a compact grid of bytes,
+# and so that comparing them is as quick as comparing any other numbers
+FLOOR = 0
+EMPTY = 1
+OCCUPIED = 2
+
+# how each letter in the input maps to a seat state
+SEAT_STATE_MAP = {
+    '.': FLOOR,
+    'L': EMPTY,
+    '#': OCCUPIED,
+}
+
+# a translation table for turning a whole line of input into seat state numbers in one go, each letter
+# becomes the character with that number (e.g. 'L' becomes the character numbered 1)
+SEAT_STATE_TRANSLATION = str.maketrans({
+    letter: chr(state)
+    for letter, state in SEAT_STATE_MAP.items()
+})
+
+# all the possible direction vectors that we will look in
+DIRECTIONS = (
+    (-1, -1), (+0, -1), (+1, -1),
+    (-1, +0),           (+1, +0),
+    (-1, +1), (+0, +1), (+1, +1),
+)
 
 
 @dataclass
 class SeatingPlan:
     """the state of all seats"""
 
-    seats: List[SeatState]
-    width: int
+    # a 2-dimensional grid of seat states, one byte per seat, indexed as seats[y, x]
+    seats: np.ndarray
+    # the position (y * width + x) of every seat in the grid, the floor in between never changes so we skip it
+    seat_positions: np.ndarray
+    # for every seat (in the same order as seat_positions), which seat is the first one visible in each direction,
+    # or -1 for none
+    visible_seats: np.ndarray
+
+    @property
+    def width(self) -> int:
+        """how many columns of seats there are"""
+
+        return self.seats.shape[1]
 
     @property
     def height(self) -> int:
         """how many rows of seats there are"""
 
-        return int(len(self.seats) / self.width)
+        return self.seats.shape[0]
+
+    def seat_states(self, workspace: Optional['NeighbourCountWorkspace'] = None) -> np.ndarray:
+        """get the state of every seat (in the same order as seat_positions), skipping the floor"""
+
+        # if we haven't been given somewhere to put the result, make somewhere
+        if workspace is None:
+            workspace = NeighbourCountWorkspace.for_plan(self)
+
+        return np.take(self.seats, self.seat_positions, out=workspace.seat_states)
 
-    def get(self, x: int, y: int) -> Optional[SeatState]:
-        """get the state of a particular seat, returns None if invalid coordinate"""
+    def occupied_neighbour_counts(self, workspace: Optional['NeighbourCountWorkspace'] = None) -> np.ndarray:
+        """count, for every seat at once (in the same order as seat_positions), how many occupied seats it can see"""
 
-        # check for valid coordinate
-        if x < 0 or y < 0 or x >= self.width or y >= self.height:
-            return None
+        # if we haven't been given somewhere to do the work, make somewhere
+        if workspace is None:
+            workspace = NeighbourCountWorkspace.for_plan(self)
 
-        # get the seat
-        index = self._index(x, y)
-        return self.seats[index]
+        # make one long row of True/False for whether each seat is occupied, leaving the False on the end of the
+        # workspace alone, so that the -1 used for "no seat in that direction" looks up that False
+        np.equal(self.seat_states(workspace), OCCUPIED, out=workspace.occupied[:-1])
 
-    def set(self, x: int, y: int, value: SeatState):
-        """update the state of a particular seat"""
+        # look up every visible seat for every seat in one go, then add them up for each seat
+        np.take(workspace.occupied, self.visible_seats, out=workspace.visible_occupied)
+        return np.sum(workspace.visible_occupied, axis=1, out=workspace.counts)
+
+    def clone(self) -> 'SeatingPlan':
+        """creates a separate copy of the seating plan"""
+
+        return SeatingPlan(
+            seats=self.seats.copy(),
+            # floor never changes, so neither do where the seats are or which seats can be seen from where,
+            # so these can be shared
+            seat_positions=self.seat_positions,
+            visible_seats=self.visible_seats,
+        )
+
+
+@dataclass
+class NeighbourCountWorkspace:
+    """
+    working space for counting occupied neighbours
+
+    every step of the simulation needs arrays of exactly the same sizes, so rather than creating new ones every step
+    we make them once for the size of the seating plan and reuse them
+    """
+
+    # the state of each seat
+    seat_states: np.ndarray
+    # whether each seat is occupied, with an extra False on the end for "no seat"
+    occupied: np.ndarray
+    # whether each seat visible from each seat is occupied
+    visible_occupied: np.ndarray
+    # how many occupied seats are visible from each seat
+    counts: np.ndarray
+
+    @staticmethod
+    def for_plan(plan: SeatingPlan) -> 'NeighbourCountWorkspace':
+        """create working space the right size for the given seating plan"""
+
+        seat_count = len(plan.seat_positions)
+        return NeighbourCountWorkspace(
+            seat_states=np.empty(seat_count, dtype=np.int8),
+            occupied=np.zeros(seat_count + 1, dtype=bool),
+            visible_occupied=np.empty(plan.visible_seats.shape, dtype=bool),
+            counts=np.empty(seat_count, dtype=np.int8),
+        )
 
-        index = self._index(x, y)
-        self.seats[index] = value
 
-    def neighbours_of(self, x: int, y: int) -> Dict[Tuple[int, int], bool]:
-        """get whether we can see occupied seats in each direction"""
+def find_visible_seats(seats: np.ndarray, seat_positions: np.ndarray) -> np.ndarray:
+    """
+    for every seat, find which seat is the first one that can be seen in each direction
 
-        # all the possible direction vectors that we will look in
-        directions = [
-            (-1, -1), (+0, -1), (+1, -1),
-            (-1, +0),           (+1, +0),
-            (-1, +1), (+0, +1), (+1, +1),
-        ]
+    seats never turn into floor (or the other way around) so this only needs working out once, rather than
+    looking along every direction again on every step of the simulation
+    """
+
+    height, width = seats.shape
+    # plain python lists are quicker to look at one item at a time than numpy arrays
+    grid = seats.tolist()
+
+    # record which seat (in the order of seat_positions) is at each position in the grid, -1 means "no seat"
+    seat_at_position = np.full(height * width, -1, dtype=np.int32)
+    seat_at_position[seat_positions] = np.arange(len(seat_positions))
+    seat_at_position = seat_at_position.tolist()
+
+    # start by assuming there are no seats to be seen anywhere
+    visible_seats = np.full((len(seat_positions), len(DIRECTIONS)), -1, dtype=np.int32)
+    # the rules never change floor, so we only need to know what the seats can see
+    for seat_index, position in enumerate(seat_positions.tolist()):
+        y, x = divmod(position, width)
 
-        result = {}
         # for each direction
-        for (dx, dy) in directions:
+        for direction_index, (dx, dy) in enumerate(DIRECTIONS):
             # start at the adjacent position
             cx, cy = x + dx, y + dy
-            # then, until we find an answer...
-            while True:
-                # get the content of the position we're looking at
-                neighbour = self.get(cx, cy)
-                # is it empty (off the grid), or an empty seat?
-                if neighbour is None or neighbour == SeatState.Empty:
-                    # if so the first seat we've seen is not occupied, so we can stop
-                    # record that when looking in that direction we can't see an occupied seat
-                    result[(dx, dy)] = False
-                    break
-                # is it an occupied seat?
-                if neighbour == SeatState.Occupied:
-                    # if so the first seat we've seen is occupied, so we can stop
-                    # record that when looking in that direction we can see an occupied seat
-                    result[(dx, dy)] = True
+            # then, until we go off the grid...
+            while 0 <= cx < width and 0 <= cy < height:
+                # if there's a seat here, it's the first one we can see, so record which seat it is and stop
+                if grid[cy][cx] != FLOOR:
+                    visible_seats[seat_index, direction_index] = seat_at_position[cy * width + cx]
                     break
 
                 # otherwise, move onto the next position in that direction
                 cx, cy = cx + dx, cy + dy
 
-        return result
-
-    def clone(self) -> 'SeatingPlan':
-        """creates a separate copy of the seating plan"""
-
-        return SeatingPlan(
-            seats=self.seats[:],
-            width=self.width,
-        )
-
-    def _index(self, x: int, y: int) -> int:
-        """calculate the index into our list of seats based on the seating coordinate"""
-
-        return y * self.width + x
+    return visible_seats
 
 
 def load_seating_plan(f: IO) -> SeatingPlan:
     """decode seating plan from an input stream"""
 
-    seats = []
+    rows = []
 
     line_width: Optional[int] = None
     for line in f:
@@ -125,68 +184,66 @@ def load_seating_plan(f: IO) -> SeatingPlan:
         elif line_width != len(line):
             raise Exception(f"inconsistent line length in input ({line_width} so far vs {len(line)} in this line)")
 
-        # store all the decoded seats from this line of input
-        seats.extend([
-            parse_seat_state(letter)
-            for letter in line
-        ])
+        # check that we recognise every letter in the line
+        unknown_letters = set(line) - SEAT_STATE_MAP.keys()
+        if unknown_letters:
+            raise Exception(f"unknown seat states in input: {unknown_letters}")
+
+        # store all the decoded seats from this line of input, one byte per seat
+        rows.append(line.translate(SEAT_STATE_TRANSLATION).encode('latin-1'))
 
     if not line_width:
         raise Exception("no lines read from input!")
 
+    # join all the rows of bytes together and turn them into a grid, the bytearray makes sure the grid can be changed
+    seats = np.frombuffer(bytearray(b''.join(rows)), dtype=np.int8).reshape(len(rows), line_width)
+
+    # find every position in the grid that isn't floor
+    seat_positions = np.flatnonzero(seats != FLOOR)
+
     return SeatingPlan(
         seats=seats,
-        width=line_width,
+        seat_positions=seat_positions,
+        visible_seats=find_visible_seats(seats, seat_positions),
     )
 
 
-def update_seating_plan(plan: SeatingPlan) -> SeatingPlan:
-    """apply the rules from the puzzle to the seating plan, producing a new seating plan"""
+def update_seating_plan(plan: SeatingPlan, next_plan: SeatingPlan,
+                        workspace: Optional[NeighbourCountWorkspace] = None) -> Tuple[SeatingPlan, int]:
+    """
+    apply the rules from the puzzle to the seating plan, writing the result into next_plan and returning it along
+    with how many seats changed
 
-    # start with a fresh copy to mutate
-    next_plan = plan.clone()
+    next_plan (and the workspace, if given) are reused rather than created fresh every step, so the caller can flip
+    between two plans
+    """
 
-    # evaluate the rules for every position in the grid
-    for y in range(plan.height):
-        for x in range(plan.width):
-            current_state = plan.get(x, y)
-            # there are only rules for empty or occupied seats, so skip everything else
-            if current_state not in (SeatState.Empty, SeatState.Occupied):
-                continue
+    # if we haven't been given somewhere to do the work, make somewhere
+    if workspace is None:
+        workspace = NeighbourCountWorkspace.for_plan(plan)
 
-            # count the number of occupied adjacent seats
-            neighbours = plan.neighbours_of(x, y)
-            number_of_occupied_neighbours = sum(
-                1
-                for occupied in neighbours.values()
-                if occupied
-            )
+    # count the number of occupied seats visible from every seat
+    number_of_occupied_neighbours = plan.occupied_neighbour_counts(workspace)
+    # counting needed the state of every seat (skipping the floor, as the rules never change it), so that's
+    # already sitting in the workspace for us to use
+    seat_states = workspace.seat_states
 
-            # by default the next state will be the same as the current state, unless a rule overrides it
-            next_state = current_state
+    # start with the current state, by default seats stay the same unless a rule overrides it
+    np.copyto(next_plan.seats, plan.seats)
 
-            # apply the rules to this seat
-            if current_state == SeatState.Empty and number_of_occupied_neighbours == 0:
-                next_state = SeatState.Occupied
-            elif current_state == SeatState.Occupied and number_of_occupied_neighbours >= 5:
-                next_state = SeatState.Empty
+    # apply the rules to every seat at once, by building a list of True/False for which seats each rule applies to
+    becomes_occupied = (seat_states == EMPTY) & (number_of_occupied_neighbours == 0)
+    becomes_empty = (seat_states == OCCUPIED) & (number_of_occupied_neighbours >= 5)
+    # then update just the seats where the rule applied, by looking up where in the grid those seats are
+    next_seats = next_plan.seats.reshape(-1)
+    next_seats[plan.seat_positions[becomes_occupied]] = OCCUPIED
+    next_seats[plan.seat_positions[becomes_empty]] = EMPTY
 
-            # if the seat state has changed, record the change
-            if next_state != current_state:
-                next_plan.set(x, y, next_state)
+    # the rules are the only thing that change seats, and no seat is changed by both, so we already know how many
+    # seats changed without having to compare the two plans
+    changes = int(np.count_nonzero(becomes_occupied) + np.count_nonzero(becomes_empty))
 
-    return next_plan
-
-
-def count_differences(a: SeatingPlan, b: SeatingPlan) -> int:
-    """count how many seats have a different state between two seating plans"""
-
-    return sum(
-        # yield a 1 if the seats are different, otherwise a 0
-        1 if seat_a != seat_b else 0
-        # when comparing each corresponding seat in the two seating plans
-        for seat_a, seat_b in zip(a.seats, b.seats)
-    )
+    return next_plan, changes
 
 
 def main():
@@ -203,18 +260,27 @@ def main():
 
     # load the initial plan
     seating_plan = _reset()
+    # and make a second plan of the same size for each simulation step to write its result into
+    spare_seating_plan = seating_plan.clone()
+    # as well as somewhere for each simulation step to do its work
+    workspace = NeighbourCountWorkspace.for_plan(seating_plan)
 
     # record whether the user wants to keep watching the program think, set to False to exit early
     running = True
-    # how should we draw the state of the seats on screen in terms of colours
-    plan_colours = {
-        SeatState.Empty: (100, 100, 255),
-        SeatState.Occupied: (255, 100, 100),
-    }
+    # how should we draw the state of the seats on screen in terms of colours, each row is the colour for the
+    # seat state with that number, so we can look up the colour of every seat in the grid in one go
+    plan_colours = np.array([
+        # FLOOR
+        (255, 255, 255),
+        # EMPTY
+        (100, 100, 255),
+        # OCCUPIED
+        (255, 100, 100),
+    ], dtype=np.uint8)
     # create a surface to draw our seating plan to
     seating_plan_surface = pygame.Surface(size=(seating_plan.width, seating_plan.height))
-    # start the seating plan as all white
-    seating_plan_surface.fill((255, 255, 255))
+    # whether the seating plan has changed since we last drew it, so we don't redraw it when nothing has changed
+    needs_redraw = True
 
     # whether or not the simulation continues on its own (True) or whether it waits for you to say "next" (False)
     auto_run = True
@@ -243,6 +309,7 @@ def main():
                 # if it was the R key, reset the simulation back to the contents of the puzzle input
                 elif event.key == pygame.K_r:
                     seating_plan = _reset()
+                    needs_redraw = True
                 # if it was the space key, toggle whether the input plays out on its own, or waits for input
                 elif event.key == pygame.K_SPACE:
                     auto_run = not auto_run
@@ -254,22 +321,21 @@ def main():
             print(f"step {step}")
 
             # update the simulation
-            next_seating_plan = update_seating_plan(seating_plan)
-            changes = count_differences(seating_plan, next_seating_plan)
+            next_seating_plan, changes = update_seating_plan(seating_plan, spare_seating_plan, workspace)
             print(f"  {changes} changes")
 
-            # update the seating plan with the result of the simulation step
-            seating_plan = next_seating_plan
+            # update the seating plan with the result of the simulation step, and keep the old one around
+            # so the next step can overwrite it rather than allocating a whole new plan
+            seating_plan, spare_seating_plan = next_seating_plan, seating_plan
+            needs_redraw = needs_redraw or changes != 0
 
-        # update the drawing of the seating plan
-        for y in range(seating_plan.height):
-            for x in range(seating_plan.width):
-                seat = seating_plan.get(x, y)
-                # does the state of this seat have a colour?
-                colour = plan_colours.get(seat)
-                # if so, draw the colour
-                if colour:
-                    seating_plan_surface.set_at((x, y), colour)
+        # update the drawing of the seating plan if it has changed
+        if needs_redraw:
+            # look up the colour of every seat, giving a grid of colours indexed as [y, x]
+            colours = plan_colours[seating_plan.seats]
+            # pygame wants the pixels indexed as [x, y], so swap the axes around and copy them onto the surface
+            pygame.surfarray.blit_array(seating_plan_surface, colours.swapaxes(0, 1))
+            needs_redraw = False
 
         # scale up the small seating plan (each pixel is a seat!) so that it fills the display
         pygame.transform.scale(seating_plan_surface, display.get_size(), display)
@@ -277,11 +343,7 @@ def main():
         pygame.display.flip()
 
     # count how many seats were occupied
-    occupied_seats = sum(
-        1
-        for seat in seating_plan.seats
-        if seat == SeatState.Occupied
-    )
+    occupied_seats = np.count_nonzero(seating_plan.seats == OCCUPIED)
     print(f"{occupied_seats} occupied seats when equilibrium reached")
 
 
@@ -1,6 +1,5 @@
 import enum
-import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @enum.unique
@@ -16,16 +15,42 @@ class Operation(enum.Enum):
     Forward = enum.auto()
 
 
-def compass_direciton_to_vector(operation: Operation) -> 'Vector2':
+# positions and directions are stored as complex numbers, where the real part is how far east something is and the
+# imaginary part is how far south it is, python does the arithmetic on both parts for us in one go
+#
+# note: this means multiplying by 1j turns a direction 90 degrees clockwise (right), e.g. east (1) becomes south (1j)
+COMPASS_DIRECTIONS = {
+    Operation.North: -1j,
+    Operation.East: 1,
+    Operation.South: 1j,
+    Operation.West: -1,
+}
+
+# the directions the ship can face, in clockwise order, so turning right by 90 degrees moves one step along the list
+HEADINGS = (
+    COMPASS_DIRECTIONS[Operation.East],
+    COMPASS_DIRECTIONS[Operation.South],
+    COMPASS_DIRECTIONS[Operation.West],
+    COMPASS_DIRECTIONS[Operation.North],
+)
+
+
+def compass_direciton_to_vector(operation: Operation) -> complex:
     """convert a compass direction into a vector"""
 
-    mapping = {
-        Operation.North: Vector2(+0.0, -1.0),
-        Operation.East:  Vector2(+1.0, +0.0),
-        Operation.South: Vector2(+0.0, +1.0),
-        Operation.West:  Vector2(-1.0, +0.0),
-    }
-    return mapping[operation]
+    return COMPASS_DIRECTIONS[operation]
+
+
+# how each letter in the input maps to an operation
+OPERATION_MAP = {
+    'N': Operation.North,
+    'E': Operation.East,
+    'S': Operation.South,
+    'W': Operation.West,
+    'L': Operation.Left,
+    'R': Operation.Right,
+    'F': Operation.Forward,
+}
 
 
 @dataclass
@@ -42,16 +67,7 @@ def parse_instruction(line: str) -> Instruction:
     operation_str = line[0]
     argument = int(line[1:])
 
-    operation_map = {
-        'N': Operation.North,
-        'E': Operation.East,
-        'S': Operation.South,
-        'W': Operation.West,
-        'L': Operation.Left,
-        'R': Operation.Right,
-        'F': Operation.Forward,
-    }
-    operation = operation_map[operation_str]
+    operation = OPERATION_MAP[operation_str]
 
     return Instruction(
         operation=operation,
@@ -59,67 +75,39 @@ def parse_instruction(line: str) -> Instruction:
     )
 
 
-@dataclass
-class Vector2:
-    """represent a 2-dimensional vector, a direction and a magnitude"""
-
-    x: float = 0.0
-    y: float = 0.0
-
-    def __add__(self, other: 'Vector2') -> 'Vector2':
-        """returns the sum of this vector and the provided vector"""
-
-        return Vector2(
-            x=self.x + other.x,
-            y=self.y + other.y,
-        )
-
-    def __mul__(self, other: float) -> 'Vector2':
-        """returns the result of multiplying this vector by the provided scalar value"""
-
-        return Vector2(
-            x=self.x * other,
-            y=self.y * other,
-        )
-
-    def manhattan_distance(self) -> float:
-        """returns the manhattan distance of this vector"""
-
-        return abs(self.x) + abs(self.y)
-
-    @staticmethod
-    def from_heading(heading_degrees: float, magnitude: float) -> 'Vector2':
-        """constructs a vector from a heading (in degrees) and magnitude"""
+def manhattan_distance(vector: complex) -> float:
+    """returns the manhattan distance of a vector"""
 
-        heading_radians = heading_degrees * math.pi / 180.0
-        return Vector2(
-            x=math.cos(heading_radians) * magnitude,
-            y=math.sin(heading_radians) * magnitude,
-        )
+    return abs(vector.real) + abs(vector.imag)
 
 
 @dataclass
 class Ship:
     """the ship that follows navigation instructions"""
 
-    position: Vector2 = field(default_factory=Vector2)
-    heading: float = 0.0
+    position: complex = 0j
+    # the direction the ship is facing, as a position in the list of HEADINGS, it starts off facing east
+    heading: int = 0
 
     def follow_instruction(self, instruction: Instruction):
         """updates the ship's position by following a navigation instruction"""
 
         # first see if we're moving in an absolute compass direction
         if instruction.operation in (Operation.North, Operation.East, Operation.South, Operation.West):
-            self.position = self.position + compass_direciton_to_vector(instruction.operation) * instruction.argument
+            self.position += compass_direciton_to_vector(instruction.operation) * instruction.argument
         # otherwise if we're turning left and right
         elif instruction.operation in (Operation.Left, Operation.Right):
             heading_change = instruction.argument
             if instruction.operation == Operation.Left:
                 heading_change = -heading_change
-            self.heading = (self.heading + heading_change) % 360
+            # the ship only ever faces one of the four compass directions, so we can only turn by multiples of 90
+            if heading_change % 90 != 0:
+                raise Exception(f"can only turn by multiples of 90 degrees, not {instruction.argument}")
+            # turning is just moving along the list of headings, wrapping around at the end
+            self.heading = (self.heading + heading_change // 90) % len(HEADINGS)
         # finally, are we just moving in the current heading
         elif instruction.operation == Operation.Forward:
-            self.position = self.position + Vector2.from_heading(self.heading, instruction.argument)
+            self.position += HEADINGS[self.heading] * instruction.argument
 
 
 def main():
@@ -127,7 +115,10 @@ def main():
     with open('input/day12.txt') as f:
         instructions = [
             parse_instruction(line)
-            for line in f
+            # read the whole file in one go, and split it up into lines
+            for line in f.read().splitlines()
+            # skipping any blank lines
+            if line
         ]
 
     # create a new ship
@@ -136,7 +127,7 @@ def main():
     for i in instructions:
         ship.follow_instruction(i)
 
-    print(f"ships manhattan distance from its starting position: {int(ship.position.manhattan_distance())}")
+    print(f"ships manhattan distance from its starting position: {int(manhattan_distance(ship.position))}")
 
 
 if __name__ == "__main__":
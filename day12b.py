@@ -1,6 +1,5 @@
 import enum
-import math
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 
 @enum.unique
@@ -16,16 +15,42 @@ class Operation(enum.Enum):
     Forward = enum.auto()
 
 
-def compass_direciton_to_vector(operation: Operation) -> 'Vector2':
+# positions and directions are stored as complex numbers, where the real part is how far east something is and the
+# imaginary part is how far south it is, python does the arithmetic on both parts for us in one go
+#
+# note: this means multiplying by 1j turns a direction 90 degrees clockwise (right), e.g. east (1) becomes south (1j)
+COMPASS_DIRECTIONS = {
+    Operation.North: -1j,
+    Operation.East: 1,
+    Operation.South: 1j,
+    Operation.West: -1,
+}
+
+# turning right by a multiple of 90 degrees is the same as multiplying by one of these
+RIGHT_TURNS = {
+    0: 1,
+    90: 1j,
+    180: -1,
+    270: -1j,
+}
+
+
+def compass_direciton_to_vector(operation: Operation) -> complex:
     """convert a compass direction into a vector"""
 
-    mapping = {
-        Operation.North: Vector2(+0.0, -1.0),
-        Operation.East:  Vector2(+1.0, +0.0),
-        Operation.South: Vector2(+0.0, +1.0),
-        Operation.West:  Vector2(-1.0, +0.0),
-    }
-    return mapping[operation]
+    return COMPASS_DIRECTIONS[operation]
+
+
+# how each letter in the input maps to an operation
+OPERATION_MAP = {
+    'N': Operation.North,
+    'E': Operation.East,
+    'S': Operation.South,
+    'W': Operation.West,
+    'L': Operation.Left,
+    'R': Operation.Right,
+    'F': Operation.Forward,
+}
 
 
 @dataclass
@@ -42,16 +67,7 @@ def parse_instruction(line: str) -> Instruction:
     operation_str = line[0]
     argument = int(line[1:])
 
-    operation_map = {
-        'N': Operation.North,
-        'E': Operation.East,
-        'S': Operation.South,
-        'W': Operation.West,
-        'L': Operation.Left,
-        'R': Operation.Right,
-        'F': Operation.Forward,
-    }
-    operation = operation_map[operation_str]
+    operation = OPERATION_MAP[operation_str]
 
     return Instruction(
         operation=operation,
@@ -59,96 +75,39 @@ def parse_instruction(line: str) -> Instruction:
     )
 
 
-@dataclass
-class Vector2:
-    """represent a 2-dimensional vector, a direction and a magnitude"""
-
-    x: float = 0.0
-    y: float = 0.0
-
-    def __add__(self, other: 'Vector2') -> 'Vector2':
-        """returns the sum of this vector and the provided vector"""
-
-        return Vector2(
-            x=self.x + other.x,
-            y=self.y + other.y,
-        )
-
-    def __mul__(self, other: float) -> 'Vector2':
-        """returns the result of multiplying this vector by the provided scalar value"""
-
-        return Vector2(
-            x=self.x * other,
-            y=self.y * other,
-        )
-
-    def angle(self) -> float:
-        """the angle of this vector from 'east'"""
-
-        return math.degrees(math.atan2(self.y, self.x))
-
-    def magnitude_squared(self) -> float:
-        """the magnitude of this vector squared"""
-
-        return self.x ** 2 + self.y ** 2
-
-    def magnitude(self) -> float:
-        """the magnitude of this vector"""
-
-        return math.sqrt(self.magnitude_squared())
-
-    def rotate_by(self, angle_degrees: float) -> 'Vector2':
-        """rotate this vector around its origin by the specified number of degrees"""
-
-        # work out the current rotation
-        current_angle_degrees = self.angle()
-        # work out its current length
-        current_magnitude = self.magnitude()
-
-        # just create a new vector with an updated rotation, but the same length
-        return Vector2.from_heading(
-            heading_degrees=current_angle_degrees + angle_degrees,
-            magnitude=current_magnitude,
-        )
-
-    def manhattan_distance(self) -> float:
-        """returns the manhattan distance of this vector"""
-
-        return abs(self.x) + abs(self.y)
-
-    @staticmethod
-    def from_heading(heading_degrees: float, magnitude: float) -> 'Vector2':
-        """constructs a vector from a heading (in degrees) and magnitude"""
+def manhattan_distance(vector: complex) -> float:
+    """returns the manhattan distance of a vector"""
 
-        heading_radians = heading_degrees * math.pi / 180.0
-        return Vector2(
-            x=math.cos(heading_radians) * magnitude,
-            y=math.sin(heading_radians) * magnitude,
-        )
+    return abs(vector.real) + abs(vector.imag)
 
 
 @dataclass
 class Ship:
     """the ship that follows navigation instructions"""
 
-    position: Vector2 = field(default_factory=Vector2)
-    waypoint: Vector2 = field(default_factory=lambda: Vector2(x=10.0, y=-1.0))
+    position: complex = 0j
+    # the waypoint starts 10 units east and 1 unit north of the ship
+    waypoint: complex = 10 - 1j
 
     def follow_instruction(self, instruction: Instruction):
         """updates the ship's position by following a navigation instruction"""
 
         # first see if we're moving the waypoint in an absolute compass direction
         if instruction.operation in (Operation.North, Operation.East, Operation.South, Operation.West):
-            self.waypoint = self.waypoint + compass_direciton_to_vector(instruction.operation) * instruction.argument
+            self.waypoint += compass_direciton_to_vector(instruction.operation) * instruction.argument
         # otherwise if we're rotating the waypoint left and right
         elif instruction.operation in (Operation.Left, Operation.Right):
             heading_change = instruction.argument
             if instruction.operation == Operation.Left:
                 heading_change = -heading_change
-            self.waypoint = self.waypoint.rotate_by(heading_change)
+            # we can only rotate exactly by multiples of 90 degrees, which is all the navigation computer asks for
+            if heading_change % 90 != 0:
+                raise Exception(f"can only rotate the waypoint by multiples of 90 degrees, not {instruction.argument}")
+            # rotating the waypoint around the ship is just multiplying it by the right amount of "turn"
+            self.waypoint *= RIGHT_TURNS[heading_change % 360]
         # finally, are we just moving toward the current waypoint
         elif instruction.operation == Operation.Forward:
-            self.position = self.position + self.waypoint * instruction.argument
+            self.position += self.waypoint * instruction.argument
 
 
 def main():
@@ -156,7 +115,10 @@ def main():
     with open('input/day12.txt') as f:
         instructions = [
             parse_instruction(line)
-            for line in f
+            # read the whole file in one go, and split it up into lines
+            for line in f.read().splitlines()
+            # skipping any blank lines
+            if line
         ]
 
     # create a new ship
@@ -165,7 +127,7 @@ def main():
     for i in instructions:
         ship.follow_instruction(i)
 
-    print(f"ships manhattan distance from its starting position: {int(ship.position.manhattan_distance())}")
+    print(f"ships manhattan distance from its starting position: {int(manhattan_distance(ship.position))}")
 
 
 if __name__ == "__main__":
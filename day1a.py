@@ -2,26 +2,20 @@ from typing import List, Optional, Tuple
 
 
 def find_values_that_sum_to(values: List[int], target: int) -> Optional[Tuple[int, int]]:
-    # look at every number in the list of values, but also track the index of this number into the list
-    for index, value in enumerate(values):
-        # if the value is equal to or greater than the target, there's no point doing any more thinking
-        # as we know the numbers are sorted, we know that this number and all after it are larger than the
-        # target, so cannot possibly add together to make the target!
-        if value >= target:
-            break
-
-        # now compare to every other value in the list
-        # note: we can start at the value after the current one (this is why it's useful to know the index!)
-        #   this is because we know we've checked all number pairs up to this index in previous loops
-        for other_value in values[index + 1:]:
-            # again, if the other number is as big as the target, there's no point checking numbers after it
-            # as we sorted the values we know they only get even more "too big" after here!
-            if other_value >= target:
-                break
-
-            # do the two numbers we're looking at add to produce our target? if so, we're done! :D
-            if value + other_value == target:
-                return value, other_value
+    # remember every number we've looked at so far, sets are very quick to check "is this number in here?"
+    seen = set()
+
+    # look at every number in the list of values
+    for value in values:
+        # work out what number we'd need to add to this one to make the target
+        other_value = target - value
+
+        # if we've already seen that number, then the two numbers add together to make our target, we're done! :D
+        if other_value in seen:
+            return other_value, value
+
+        # otherwise remember this number, in case a later number needs it to make the target
+        seen.add(value)
 
     # if we get here, we've searched every combination available, so there is no solution somehow! :(
     return None
@@ -31,8 +25,9 @@ def main():
     target = 2020
 
     # load the numbers from our input file
+    # (reading the whole file in one go and splitting it on whitespace also skips any blank lines for us)
     with open('input/day1.txt') as f:
-        values = [int(line) for line in f if line]
+        values = [int(word) for word in f.read().split()]
 
     # sort the numbers so we can make some assumptions
     values.sort()
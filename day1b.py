@@ -2,6 +2,9 @@ from typing import List, Optional, Tuple
 
 
 def find_values_that_sum_to(values: List[int], target: int) -> Optional[Tuple[int, int, int]]:
+    # put every number into a set once up front, sets are very quick to check "is this number in here?"
+    all_values = set(values)
+
     # look at every number in the list of values, but also track the index of this number into the list
     for index, first_value in enumerate(values):
         # if the value is equal to or greater than the target, there's no point doing any more thinking
@@ -10,24 +13,32 @@ def find_values_that_sum_to(values: List[int], target: int) -> Optional[Tuple[in
         if first_value >= target:
             break
 
-        # now compare to every other value in the list
+        # whatever the other two numbers are, they need to add up to whatever is left over
+        remaining = target - first_value
+
         # note: we can start at the value after the current one (this is why it's useful to know the index!)
-        #   this is because we know we've checked all number pairs up to this index in previous loops
-        for inner_index, second_value in enumerate(values[index + 1:]):
-            # again, if the other number is as big as the target, there's no point checking numbers after it
-            # as we sorted the values we know they only get even more "too big" after here!
-            if second_value >= target:
+        #   this is because we know we've checked all number combinations up to this index in previous loops
+        #   we use a range of indexes rather than `values[index + 1:]` so we don't copy the list every time
+        for inner_index in range(index + 1, len(values)):
+            second_value = values[inner_index]
+            # work out what the third number would have to be
+            third_value = remaining - second_value
+
+            # we only look for a third number that's bigger than the second, any smaller and it would have come
+            # earlier in the sorted list, so we've already tried it as a second number! this also means that
+            # once the third number would be smaller than the second, there's nothing left to find
+            if third_value < second_value:
                 break
 
-            # same idea as above, but looking at possible third numbers
-            for third_value in values[inner_index+1:]:
-                # again, if it's too big, no point checking the bigger numbers after it
-                if third_value >= target:
-                    break
-
-                # do the three numbers we're looking at add to produce our target? if so, we're done! :D
-                if first_value + second_value + third_value == target:
+            # if the third number is the same as the second, we need another copy of it straight after this one
+            if third_value == second_value:
+                if inner_index + 1 < len(values) and values[inner_index + 1] == third_value:
                     return first_value, second_value, third_value
+                break
+
+            # otherwise, check whether the third number is anywhere in our set of numbers, if so we're done! :D
+            if third_value in all_values:
+                return first_value, second_value, third_value
 
     # if we get here, we've searched every combination available, so there is no solution somehow! :(
     return None
@@ -37,8 +48,9 @@ def main():
     target = 2020
 
     # load the numbers from our input file
+    # (reading the whole file in one go and splitting it on whitespace also skips any blank lines for us)
     with open('input/day1.txt') as f:
-        values = [int(line) for line in f if line]
+        values = [int(word) for word in f.read().split()]
 
     # sort the numbers so we can make some assumptions
     values.sort()
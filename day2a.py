@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-import re
 
 
 @dataclass
 class PasswordPolicy:
+    # declaring slots means each instance doesn't need its own attribute dictionary, so it's smaller and quicker to
+    # create, which adds up when there's one of these for every line of the input
+    __slots__ = ('min_occurrences', 'max_occurrences', 'letter')
+
     min_occurrences: int
     max_occurrences: int
     letter: str
@@ -11,35 +14,44 @@ class PasswordPolicy:
 
 @dataclass
 class PasswordEntry:
+    __slots__ = ('policy', 'password')
+
     policy: PasswordPolicy
     password: str
 
 
-# this is a regular expression, it is designed to match specific patterns of text (the lines of text in the input file)
-# it splits the line up into the individual pieces described in the puzzle
-PASSWORD_ENTRY_REGEX = re.compile(r'^\s*(?P<min>\d+)-(?P<max>\d+)\s+(?P<letter>[a-zA-Z])\s*:\s*(?P<password>.+)\s*$')
+def build_password_entry_from_line(line: str) -> PasswordEntry:
+    # each line looks like "1-3 a: abcde", so first split it up by spaces into "1-3", "a:" and "abcde"
+    # (we strip the line first to get rid of the newline on the end)
+    parts = line.strip().split(' ', 2)
+    if len(parts) != 3:
+        raise Exception(f"failed to parse password database entry: {line}")
+    numbers, letter_and_colon, password = parts
 
+    # the first part is two numbers separated by a dash
+    lo, separator, hi = numbers.partition('-')
+    # the second part is a single letter followed by a colon
+    letter, colon = letter_and_colon[:-1], letter_and_colon[-1:]
 
-def build_password_entry_from_line(line: str) -> PasswordEntry:
-    # try and match our regular expression to the line of text from the input
-    match = PASSWORD_ENTRY_REGEX.fullmatch(line)
-    if not match:
+    # check everything looks like we expect it to
+    if not separator or not lo.isdigit() or not hi.isdigit() or len(letter) != 1 or not letter.isalpha() \
+            or colon != ':' or not password:
         raise Exception(f"failed to parse password database entry: {line}")
 
-    # now it's matched, we can store the individual values into our password entry
+    # now it's been split up, we can store the individual values into our password entry
     return PasswordEntry(
         policy=PasswordPolicy(
-            min_occurrences=int(match.group('min')),
-            max_occurrences=int(match.group('max')),
-            letter=match.group('letter'),
+            min_occurrences=int(lo),
+            max_occurrences=int(hi),
+            letter=letter,
         ),
-        password=match.group('password'),
+        password=password,
     )
 
 
 def does_password_satisfy_policy(password: str, policy: PasswordPolicy) -> bool:
     # count the number of letters in the password that match the policy
-    occurrences = len([letter for letter in password if letter == policy.letter])
+    occurrences = password.count(policy.letter)
     # return whether the number of occurrences is within the limits specified in the policy
     return policy.min_occurrences <= occurrences <= policy.max_occurrences
 
@@ -47,7 +59,8 @@ def does_password_satisfy_policy(password: str, policy: PasswordPolicy) -> bool:
 def main():
     # load the 'passwords' from our input file
     with open('input/day2.txt') as f:
-        entries = [build_password_entry_from_line(line) for line in f if line]
+        # read the whole file in one go and split it into lines, skipping any blank ones
+        entries = [build_password_entry_from_line(line) for line in f.read().splitlines() if line]
 
     # find all the entries that pass the corresponding password policy
     valid_entries = [entry for entry in entries if does_password_satisfy_policy(entry.password, entry.policy)]
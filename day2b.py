@@ -1,9 +1,12 @@
 from dataclasses import dataclass
-import re
 
 
 @dataclass
 class PasswordPolicy:
+    # declaring slots means each instance doesn't need its own attribute dictionary, so it's smaller and quicker to
+    # create, which adds up when there's one of these for every line of the input
+    __slots__ = ('position_a', 'position_b', 'letter')
+
     position_a: int
     position_b: int
     letter: str
@@ -11,51 +14,57 @@ class PasswordPolicy:
 
 @dataclass
 class PasswordEntry:
+    __slots__ = ('policy', 'password')
+
     policy: PasswordPolicy
     password: str
 
 
-# this is a regular expression, it is designed to match specific patterns of text (the lines of text in the input file)
-# it splits the line up into the individual pieces described in the puzzle
-PASSWORD_ENTRY_REGEX = re.compile(r'^\s*(?P<a>\d+)-(?P<b>\d+)\s+(?P<letter>[a-zA-Z])\s*:\s*(?P<password>.+)\s*$')
+def build_password_entry_from_line(line: str) -> PasswordEntry:
+    # each line looks like "1-3 a: abcde", so first split it up by spaces into "1-3", "a:" and "abcde"
+    # (we strip the line first to get rid of the newline on the end)
+    parts = line.strip().split(' ', 2)
+    if len(parts) != 3:
+        raise Exception(f"failed to parse password database entry: {line}")
+    numbers, letter_and_colon, password = parts
 
+    # the first part is two numbers separated by a dash
+    a, separator, b = numbers.partition('-')
+    # the second part is a single letter followed by a colon
+    letter, colon = letter_and_colon[:-1], letter_and_colon[-1:]
 
-def build_password_entry_from_line(line: str) -> PasswordEntry:
-    # try and match our regular expression to the line of text from the input
-    match = PASSWORD_ENTRY_REGEX.fullmatch(line)
-    if not match:
+    # check everything looks like we expect it to
+    if not separator or not a.isdigit() or not b.isdigit() or len(letter) != 1 or not letter.isalpha() \
+            or colon != ':' or not password:
         raise Exception(f"failed to parse password database entry: {line}")
 
-    # now it's matched, we can store the individual values into our password entry
+    # now it's been split up, we can store the individual values into our password entry
     return PasswordEntry(
         policy=PasswordPolicy(
-            position_a=int(match.group('a')),
-            position_b=int(match.group('b')),
-            letter=match.group('letter'),
+            position_a=int(a),
+            position_b=int(b),
+            letter=letter,
         ),
-        password=match.group('password'),
+        password=password,
     )
 
 
 def does_password_satisfy_policy(password: str, policy: PasswordPolicy) -> bool:
-    matching_letter_positions = [
-        # keep the indexes (1 indexed)
-        index + 1
-        # of every letter in the password
-        for index, letter in enumerate(password)
-        # where the index is one of the ones specified in the policy
-        # AND the letter in that position matches the letter specified in the policy
-        if (index + 1) in (policy.position_a, policy.position_b) and letter == policy.letter
-    ]
+    # look straight at the two letters the policy cares about (the positions are 1 indexed, so take 1 off)
+    # note: we slice out a single letter rather than indexing, so a position past the end of the password just
+    # gives us an empty string instead of an error
+    letter_a_matches = password[policy.position_a - 1:policy.position_a] == policy.letter
+    letter_b_matches = password[policy.position_b - 1:policy.position_b] == policy.letter
 
     # the rules say that EXACTLY ONE of those positions can contain the letter
-    return len(matching_letter_positions) == 1
+    return letter_a_matches != letter_b_matches
 
 
 def main():
     # load the 'passwords' from our input file
     with open('input/day2.txt') as f:
-        entries = [build_password_entry_from_line(line) for line in f if line]
+        # read the whole file in one go and split it into lines, skipping any blank ones
+        entries = [build_password_entry_from_line(line) for line in f.read().splitlines() if line]
 
     # find all the entries that pass the corresponding password policy
     valid_entries = [entry for entry in entries if does_password_satisfy_policy(entry.password, entry.policy)]
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List
 import enum
 
 
@@ -29,19 +29,6 @@ class Map:
 
         return len(self.rows[0])
 
-    def get_contents_at(self, position: 'Vec2') -> Optional[CellContents]:
-        """get the contents of the specified cell, accounting for the fact the map repeats on the horizontal axis"""
-
-        # if the position is off the map then return nothing
-        if position.y > self.height:
-            return None
-
-        # get the row of the map
-        row = self.rows[position.y]
-
-        # now get the cell in the map, but modulus the x co-ordinate by the width of the map so that it wraps around
-        return row[position.x % len(row)]
-
 
 def build_row_of_map(line: str) -> List[CellContents]:
     """turns a line from the input file into the cells that make up a row of the map"""
@@ -66,39 +53,38 @@ def build_row_of_map(line: str) -> List[CellContents]:
 class Vec2:
     """represent a 2-dimensional vector, which can be used as a coordinate"""
 
+    # only ever an x and a y, so there's no need for each vector to have its own attribute dictionary
+    __slots__ = ('x', 'y')
+
     x: int
     y: int
 
-    def __add__(self, other: 'Vec2') -> 'Vec2':
-        """add two vectors together to produce a new one"""
-
-        return Vec2(self.x + other.x, self.y + other.y)
-
 
 def count_trees_encountered_given_slope(area: Map, start_position: Vec2, slope: Vec2) -> int:
     """
     given a map, starting position and direction of travel, calculates how many trees are encountered on the way down
     """
 
-    # our position is initially the starting position
-    position = start_position
-    # and we've seen no trees so far
+    # pull everything we need out into local variables up front, so the loop below doesn't have to keep looking
+    # them up on the map and vectors every step
+    rows = area.rows
+    height = len(rows)
+    width = len(rows[0])
+    x, y = start_position.x, start_position.y
+    dx, dy = slope.x, slope.y
+    # we've seen no trees so far
     trees_encountered = 0
 
     # while we haven't gone off the bottom of the map
-    while position.y < area.height:
-        # see what we'd hit at the current position
-        encountered = area.get_contents_at(position)
-        # if we get nothing back, we've gone off the map, so stop!
-        if encountered is None:
-            break
-
-        # if we've encountered a tree, record that fact
-        if encountered == CellContents.TREE:
+    while y < height:
+        # see what we'd hit at the current position, but modulus the x co-ordinate by the width of the map so that
+        # it wraps around - and if we've encountered a tree, record that fact
+        if rows[y][x % width] == CellContents.TREE:
             trees_encountered += 1
 
         # either way, we move to the next position based on our velocity, ready for the next loop
-        position = position + slope
+        x += dx
+        y += dy
 
     return trees_encountered
 
@@ -108,7 +94,8 @@ def main():
     with open('input/day3.txt') as f:
         map_of_area = Map(rows=[
             build_row_of_map(line)
-            for line in f
+            # read the whole file in one go and split it into lines, skipping any blank ones
+            for line in f.read().splitlines()
             if line
         ])
 
@@ -1,21 +1,18 @@
 from dataclasses import dataclass
-from typing import List, Optional
-import enum
+from typing import List
 
 
-@enum.unique
-class CellContents(enum.Enum):
-    """represent the contents of a single grid cell on the map"""
-
-    OPEN = enum.auto()
-    TREE = enum.auto()
+# the symbols used for each kind of cell on the map
+OPEN = '.'
+TREE = '#'
 
 
 @dataclass
 class Map:
     """represents a map of the area"""
 
-    rows: List[List[CellContents]]
+    # each cell is True if it has a tree in it, or False if it's open
+    rows: List[List[bool]]
 
     @property
     def height(self):
@@ -29,36 +26,17 @@ class Map:
 
         return len(self.rows[0])
 
-    def get_contents_at(self, position: 'Vec2') -> Optional[CellContents]:
-        """get the contents of the specified cell, accounting for the fact the map repeats on the horizontal axis"""
-
-        # if the position is off the map then return nothing
-        if position.y > self.height:
-            return None
-
-        # get the row of the map
-        row = self.rows[position.y]
 
-        # now get the cell in the map, but modulus the x co-ordinate by the width of the map so that it wraps around
-        return row[position.x % len(row)]
-
-
-def build_row_of_map(line: str) -> List[CellContents]:
+def build_row_of_map(line: str) -> List[bool]:
     """turns a line from the input file into the cells that make up a row of the map"""
 
-    # record which symbols we treat as what cell contents
-    letter_mappings = {
-        '.': CellContents.OPEN,
-        '#': CellContents.TREE,
-    }
-
     return [
-        # map the letter to its corresponding cell contents
-        letter_mappings[letter]
+        # record whether the cell contains a tree
+        letter == TREE
         # for every letter in the line
         for letter in line
-        # but only if the letter is one we recognise in our mapping
-        if letter in letter_mappings
+        # but only if the letter is one we recognise as a cell
+        if letter in (OPEN, TREE)
     ]
 
 
@@ -66,41 +44,30 @@ def build_row_of_map(line: str) -> List[CellContents]:
 class Vec2:
     """represent a 2-dimensional vector, which can be used as a coordinate"""
 
+    # only ever an x and a y, so there's no need for each vector to have its own attribute dictionary
+    __slots__ = ('x', 'y')
+
     x: int
     y: int
 
-    def __add__(self, other: 'Vec2') -> 'Vec2':
-        """add two vectors together to produce a new one"""
-
-        return Vec2(self.x + other.x, self.y + other.y)
-
 
 def count_trees_encountered_given_slope(area: Map, start_position: Vec2, slope: Vec2) -> int:
     """
     given a map, starting position and direction of travel, calculates how many trees are encountered on the way down
     """
 
-    # our position is initially the starting position
-    position = start_position
-    # and we've seen no trees so far
-    trees_encountered = 0
-
-    # while we haven't gone off the bottom of the map
-    while position.y < area.height:
-        # see what we'd hit at the current position
-        encountered = area.get_contents_at(position)
-        # if we get nothing back, we've gone off the map, so stop!
-        if encountered is None:
-            break
-
-        # if we've encountered a tree, record that fact
-        if encountered == CellContents.TREE:
-            trees_encountered += 1
-
-        # either way, we move to the next position based on our velocity, ready for the next loop
-        position = position + slope
+    # rather than stepping one cell at a time, take every row we'll land on by slicing the rows with a step of the
+    # slope's vertical component - the slice stops at the bottom of the map for us, so we can't go off the map
+    rows_visited = area.rows[start_position.y::slope.y]
+    width = area.width
 
-    return trees_encountered
+    # on the n-th row we visit, we'll have moved n lots of the slope's horizontal component to the right, and we
+    # modulus that by the width of the map so that it wraps around
+    return sum(
+        1
+        for step, row in enumerate(rows_visited)
+        if row[(start_position.x + step * slope.x) % width]
+    )
 
 
 def main():
@@ -108,7 +75,8 @@ def main():
     with open('input/day3.txt') as f:
         map_of_area = Map(rows=[
             build_row_of_map(line)
-            for line in f
+            # read the whole file in one go and split it into lines, skipping any blank ones
+            for line in f.read().splitlines()
             if line
         ])
 
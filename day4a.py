@@ -7,46 +7,33 @@ class Passport:
     fields: Dict[str, str]
 
 
+# the fields every passport must have
+#
+# note: 'cid' isn't in here, as a sneaky hack to let north pole passports be legal ;0 omg
+REQUIRED_FIELDS = frozenset((
+    'byr', 'iyr', 'eyr',
+    'hgt', 'hcl', 'ecl',
+    'pid',
+))
+
+
 def load_passports(f: IO) -> List[Passport]:
     """loads all of the passports from the provided IO object"""
 
-    passports = []
-
-    fields = {}
-    # go through each line of the file
-    for line in f:
-        # if this is a blank line and we've read some fields in so far, then this is the end of a passport
-        if not line.strip() and fields:
-            # so store the fields we've read so far as a new passport
-            passports.append(Passport(fields=fields))
-            # remember to reset the fields to empty ready to read the next passport
-            fields = {}
-
-        # chop the line of text by spaces
-        parts = line.split()
-        # then for each block of text
-        for part in parts:
-            # split by colon into a key and value
-            k, v = part.split(":", maxsplit=1)
-            # and record that key and value pair
-            fields[k] = v
-
-    # if we get to the end of the file, but have some fields in our dictionary
-    # then there was a passport that didn't have a blank line after it because
-    # the file ended, so let's just catch that by appending what we have as a passport
-    if fields:
-        passports.append(Passport(fields=fields))
-
-    return passports
-
-
-def validate_passport(passport: Passport, required_fields: List[str]) -> bool:
+    # passports are separated by blank lines, so read the whole file and split it wherever there's a blank line
+    # then each passport's fields are separated by whitespace, and each field is a key and value split by a colon
+    return [
+        Passport(fields=dict(part.split(':', maxsplit=1) for part in record.split()))
+        for record in f.read().split('\n\n')
+        # ignore any records that are just whitespace, e.g. if the file ends with a blank line
+        if record.strip()
+    ]
+
+
+def validate_passport(passport: Passport) -> bool:
     """determines whether a passport contains all required fields"""
 
-    return all(
-        field in passport.fields
-        for field in required_fields
-    )
+    return REQUIRED_FIELDS <= passport.fields.keys()
 
 
 def main():
@@ -56,15 +43,6 @@ def main():
 
     print(f"loaded {len(passports)} passports")
 
-    required_fields = [
-        'byr', 'iyr', 'eyr',
-        'hgt', 'hcl', 'ecl',
-        'pid', 'cid',
-    ]
-
-    # sneaky hack to let north pole passports be legal ;0 omg
-    required_fields.remove('cid')
-
     # build a list of valid passports
     valid_passports = [
         # keep each passport
@@ -72,7 +50,7 @@ def main():
         # from the passport list
         for p in passports
         # if it's valid
-        if validate_passport(p, required_fields)
+        if validate_passport(p)
     ]
 
     print(f"number of valid passports: {len(valid_passports)}!")
@@ -1,32 +1,25 @@
-from typing import List, Dict, IO, Optional, Union, Tuple
+from typing import Callable, List, Dict, IO, Optional, Tuple
 from dataclasses import dataclass
 import string
 
 
-@dataclass
-class Measurement:
-    value: int
-    measurement_unit: str
-
-
-@dataclass
-class Passport:
-    birth_year: int
-    issue_year: int
-    expiration_year: int
-    height: Measurement
-    hair_colour: str
-    eye_colour: str
-    passport_id: str
-    country_id: Optional[str]
-
-
 @dataclass
 class InvalidPassport:
     fields: Dict[str, str]
     reason: str
 
 
+# the characters allowed in the digits of a hair colour
+HEX_DIGITS = frozenset(string.hexdigits)
+# the only eye colours a passport may have
+VALID_EYE_COLOURS = frozenset(('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth'))
+# the allowed range of heights (inclusive) for each measurement unit
+HEIGHT_RANGES = {
+    'cm': (150, 193),
+    'in': (59, 76),
+}
+
+
 class PassportValidationError(Exception):
 
     def __init__(self, fields: Dict[str, str], reason: str):
@@ -37,93 +30,120 @@ class PassportValidationError(Exception):
         return f"invalid passport: {self.reason} ({self.fields})"
 
 
-def build_passport_from_fields(fields: Dict[str, str]) -> Passport:
-    required_fields = [
-        'byr', 'iyr', 'eyr',
-        'hgt', 'hcl', 'ecl',
-        'pid', 'cid',
-    ]
+def check_year(lower: int, upper: int, reason: str) -> Callable[[str], Optional[str]]:
+    """builds a rule that checks a year is a number between lower and upper (inclusive)"""
 
-    # sneaky hack to let north pole passports be legal ;0 omg
-    required_fields.remove('cid')
+    def check(value: str) -> Optional[str]:
+        if not value.isdigit() or not lower <= int(value) <= upper:
+            return reason
+        return None
+
+    return check
 
-    # check for all the required fields
-    has_required_fields = all(
-        field in fields
-        for field in required_fields
-    )
-    if not has_required_fields:
-        raise PassportValidationError(fields, "does not have all required fields")
 
-    # utility to read height measurements
-    def build_measurement_from_field(value: str) -> Measurement:
-        if value[-2:] not in ('in', 'cm'):
-            raise PassportValidationError(fields, f'"{value[-2:]}" is not a valid measurement unit')
+def check_height_unit(value: str) -> Optional[str]:
+    """checks a height is measured in centimetres or inches"""
 
-        return Measurement(
-            value=int(value[:-2]),
-            measurement_unit=value[-2:],
-        )
+    if value[-2:] not in HEIGHT_RANGES:
+        return f'"{value[-2:]}" is not a valid measurement unit'
+    return None
 
-    # read all the passport fields in as the correct types
-    passport = Passport(
-        birth_year=int(fields['byr']),
-        issue_year=int(fields['iyr']),
-        expiration_year=int(fields['eyr']),
-        height=build_measurement_from_field(fields['hgt']),
-        hair_colour=fields['hcl'],
-        eye_colour=fields['ecl'],
-        passport_id=fields['pid'],
-        country_id=fields.get('cid'),
-    )
 
-    # validate the passport rules:
+def check_height(value: str) -> Optional[str]:
+    """checks a height is a whole number, within the range allowed for its unit"""
 
-    def in_range(value, lower, upper):
-        return lower <= value <= upper
+    number, unit = value[:-2], value[-2:]
+    lower, upper = HEIGHT_RANGES[unit]
+    if not number.isdigit() or not lower <= int(number) <= upper:
+        return "invalid height"
+    return None
 
-    if not in_range(passport.birth_year, 1920, 2002):
-        raise PassportValidationError(fields, "invalid birth year")
 
-    if not in_range(passport.issue_year, 2010, 2020):
-        raise PassportValidationError(fields, "invalid issue year")
+def check_hair_colour(value: str) -> Optional[str]:
+    """checks a hair colour is a # followed by 6 hex digits"""
 
-    if not in_range(passport.expiration_year, 2020, 2030):
-        raise PassportValidationError(fields, "invalid expiration year")
+    if value[0:1] != '#':
+        return "hair colour must start with #"
+    if len(value) != 7:
+        return "hair colour must consist of # followed by 6 hex digits"
+    if not HEX_DIGITS.issuperset(value[1:]):
+        return "hair colour digits must be valid hex digits (a-z, 0-9)"
+    return None
 
-    if (passport.height.measurement_unit == 'cm' and not in_range(passport.height.value, 150, 193))\
-            or (passport.height.measurement_unit == 'in' and not in_range(passport.height.value, 59, 76)):
-        raise PassportValidationError(fields, "invalid height")
 
-    if passport.hair_colour[0:1] != '#':
-        raise PassportValidationError(fields, "hair colour must start with #")
-    if len(passport.hair_colour) != 7:
-        raise PassportValidationError(fields, "hair colour must consist of # followed by 6 hex digits")
-    if not all(letter in string.hexdigits for letter in passport.hair_colour[1:]):
-        raise PassportValidationError(fields, "hair colour digits must be valid hex digits (a-z, 0-9)")
+def check_eye_colour(value: str) -> Optional[str]:
+    """checks an eye colour is one of the allowed colours"""
 
-    if passport.eye_colour not in ('amb', 'blu', 'brn', 'gry', 'grn', 'hzl', 'oth'):
-        raise PassportValidationError(fields, "eye colour invalid")
+    if value not in VALID_EYE_COLOURS:
+        return "eye colour invalid"
+    return None
 
-    if len(passport.passport_id) != 9:
-        raise PassportValidationError(fields, "passport ID must be a 9 digit number including leading 0s")
-    if not all(digit in string.digits for digit in passport.passport_id):
-        raise PassportValidationError(fields, "passport ID must only consist of digits (0-9)")
 
-    return passport
+def check_passport_id(value: str) -> Optional[str]:
+    """checks a passport ID is a 9 digit number"""
 
+    if len(value) != 9:
+        return "passport ID must be a 9 digit number including leading 0s"
+    if not value.isdigit():
+        return "passport ID must only consist of digits (0-9)"
+    return None
 
-def load_passports(f: IO) -> Tuple[List[Passport], List[InvalidPassport]]:
-    """loads all of the passports from the provided IO object"""
 
-    # record all the good and bad passports we've read in
+# the rules every passport field must pass, as (field name, rule) - each rule returns the reason the field is invalid,
+# or None if it's valid. these are all built once up front, so checking a passport is just a walk down this table
+#
+# the height unit is checked before everything else, and the rest of the height afterwards, so that a passport with
+# several problems reports the same one it always has
+#
+# note: there's no rule for 'cid' here, as a sneaky hack to let north pole passports be legal ;0 omg
+FIELD_RULES: Tuple[Tuple[str, Callable[[str], Optional[str]]], ...] = (
+    ('hgt', check_height_unit),
+    ('byr', check_year(1920, 2002, "invalid birth year")),
+    ('iyr', check_year(2010, 2020, "invalid issue year")),
+    ('eyr', check_year(2020, 2030, "invalid expiration year")),
+    ('hgt', check_height),
+    ('hcl', check_hair_colour),
+    ('ecl', check_eye_colour),
+    ('pid', check_passport_id),
+)
+
+# the fields every passport must have, which is every field that has a rule
+REQUIRED_FIELDS = frozenset(field for field, _ in FIELD_RULES)
+
+
+def validate_passport_fields(fields: Dict[str, str]):
+    """checks the fields of a passport against all of the passport rules, raising an error if any of them fail"""
+
+    # check for all the required fields
+    if not REQUIRED_FIELDS <= fields.keys():
+        raise PassportValidationError(fields, "does not have all required fields")
+
+    # validate the passport rules, stopping at the first one that fails
+    for field, check in FIELD_RULES:
+        reason = check(fields[field])
+        if reason is not None:
+            raise PassportValidationError(fields, reason)
+
+
+def load_passports(f: IO) -> Tuple[int, List[InvalidPassport]]:
+    """loads all of the passports from the provided IO object, counting the valid ones and recording the invalid ones"""
+
+    # we only need to know how many good passports there are, but we record the bad ones so we can say why
     invalid_passports = []
-    valid_passports = []
+    valid_passport_count = 0
+
+    # passports are separated by blank lines, so read the whole file and split it wherever there's a blank line
+    for record in f.read().split('\n\n'):
+        # each passport's fields are separated by whitespace, and each field is a key and value split by a colon
+        fields = dict(part.split(':', maxsplit=1) for part in record.split())
+        # ignore any records that are just whitespace, e.g. if the file ends with a blank line
+        if not fields:
+            continue
 
-    def create_passport():
-        # try and build a valid passport
+        # check whether the passport is valid
         try:
-            valid_passports.append(build_passport_from_fields(fields))
+            validate_passport_fields(fields)
+            valid_passport_count += 1
         # if the passport is invalid, record it as such
         except PassportValidationError as e:
             invalid_passports.append(InvalidPassport(
@@ -131,46 +151,21 @@ def load_passports(f: IO) -> Tuple[List[Passport], List[InvalidPassport]]:
                 reason=e.reason,
             ))
         except Exception:
-            print(f"failed to build passport from fields {fields}")
+            print(f"failed to validate passport from fields {fields}")
             raise
 
-    fields = {}
-    # go through each line of the file
-    for line in f:
-        # if this is a blank line and we've read some fields in so far, then this is the end of a passport
-        if not line.strip() and fields:
-            # so store the fields we've read so far as a new passport
-            create_passport()
-            # remember to reset the fields to empty ready to read the next passport
-            fields = {}
-
-        # chop the line of text by spaces
-        parts = line.split()
-        # then for each block of text
-        for part in parts:
-            # split by colon into a key and value
-            k, v = part.split(":", maxsplit=1)
-            # and record that key and value pair
-            fields[k] = v
-
-    # if we get to the end of the file, but have some fields in our dictionary
-    # then there was a passport that didn't have a blank line after it because
-    # the file ended, so let's just catch that by appending what we have as a passport
-    if fields:
-        create_passport()
-
-    return valid_passports, invalid_passports
+    return valid_passport_count, invalid_passports
 
 
 def main():
     # load the passports from the input file
     with open('input/day4.txt') as f:
-        valid_passports, invalid_passports = load_passports(f)
+        valid_passport_count, invalid_passports = load_passports(f)
 
-    print(f"loaded {len(valid_passports) + len(invalid_passports)} passports")
+    print(f"loaded {valid_passport_count + len(invalid_passports)} passports")
     for p in invalid_passports:
         print(f"- invalid passport {p.fields} reason: {p.reason}")
-    print(f"number of valid passports: {len(valid_passports)}!")
+    print(f"number of valid passports: {valid_passport_count}!")
 
 
 if __name__ == '__main__':
@@ -10,33 +10,23 @@ class AnswerGroup:
     questions_answered_with_yes: Set[str]
 
 
+# the set of letters that represent questions, anything else in the input is ignored
+LOWERCASE_LETTERS = frozenset(string.ascii_lowercase)
+
+
 def load_answers_from_file(f: IO) -> List[AnswerGroup]:
     """load answers from the puzzle input"""
 
-    groups = []
-
-    answered_with_yes = set()
-    for line in f:
-        # if we encounter a blank line and have data, this is the end of a group, so record it
-        if not line.strip() and answered_with_yes:
-            groups.append(AnswerGroup(
-                questions_answered_with_yes=answered_with_yes,
-            ))
-            answered_with_yes = set()
-            continue
-
-        # otherwise, find all unique letters in this line of text
-        # and add them to the current set of unique letters
-        answered_with_yes.update(set(letter for letter in line if letter in string.ascii_lowercase))
-
-    # if we get to the end and have values in our set, then there's a group that wasn't followed
-    # by a final blank line, so record the values from that group
-    if answered_with_yes:
-        groups.append(AnswerGroup(
-            questions_answered_with_yes=answered_with_yes,
-        ))
-
-    return groups
+    # groups are separated by blank lines, so read the whole file and split it wherever there's a blank line
+    return [
+        AnswerGroup(
+            # find all the unique letters answered by anyone in the group, ignoring the newlines between passengers
+            questions_answered_with_yes=set(record) & LOWERCASE_LETTERS,
+        )
+        for record in f.read().split('\n\n')
+        # ignore any records that are just whitespace, e.g. if the file ends with a blank line
+        if record.strip()
+    ]
 
 
 def main():
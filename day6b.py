@@ -1,87 +1,108 @@
 from dataclasses import dataclass
-from typing import Set, IO, List
+from functools import reduce
+from typing import BinaryIO, Dict, Iterator, List
+import operator
 import string
 
 
-@dataclass
-class IndividualAnswers:
-    """information about the answers provided by a single passenger"""
+# rather than storing answers as sets of letters, we store them as numbers where each bit represents a question:
+# bit 0 is question 'a', bit 1 is question 'b', and so on. this means combining answers is just a bitwise AND/OR!
+QUESTION_BITS: Dict[str, int] = {
+    letter: 1 << index
+    for index, letter in enumerate(string.ascii_lowercase)
+}
+# a bitmask with every question's bit set
+ALL_QUESTIONS = reduce(operator.or_, QUESTION_BITS.values())
+
+
+# the input is read as bytes, so this maps every possible byte to its question's bit, or 0 if it isn't a question,
+# meaning any byte can just be OR'd into a bitmask without checking whether it's a question first
+BYTE_BITS = [
+    QUESTION_BITS.get(chr(byte), 0)
+    for byte in range(256)
+]
+
+
+def build_answer_bitmask(line: bytes) -> int:
+    """turns a line of answers from the input into a bitmask, ignoring anything that isn't a question"""
+
+    mask = 0
+    for byte in line:
+        mask |= BYTE_BITS[byte]
+    return mask
+
+
+def count_bits(value: int) -> int:
+    """count how many bits are set in a number"""
+
+    return bin(value).count('1')
 
-    questions_answered_with_yes: Set[str]
+
+def questions_in_bitmask(mask: int) -> str:
+    """turns a bitmask back into the letters of the questions it represents"""
+
+    return ''.join(
+        letter
+        for letter, bit in QUESTION_BITS.items()
+        if mask & bit
+    )
 
 
 @dataclass
 class AnswerGroup:
     """information about the answers provided by a group of passengers"""
 
-    passengers: List[IndividualAnswers]
-
-    @property
-    def questions_answered_with_yes(self) -> Set[str]:
-        """list all questions that had at least one passenger in this group answer yes"""
+    # bitmask of all the questions that all passengers in this group answered yes to
+    questions_everyone_answered_yes_to: int
 
-        answers = set()
-        for p in self.passengers:
-            answers.update(p.questions_answered_with_yes)
 
-        return answers
+def build_answer_group(lines: List[bytes]) -> AnswerGroup:
+    """combines the answers of every passenger in a group, where each line of the group is a different passenger"""
 
-    def questions_everyone_answered_yes_to(self) -> Set[str]:
-        """list all the questions that all passengers answered yes to"""
-
-        # start with a set of all questions anyone answered yes to
-        result = self.questions_answered_with_yes
-        # now remove all the questions somebody didn't say yes to
-        for p in self.passengers:
-            # a set intersect will only keep values that are in both sets
-            result.intersection_update(p.questions_answered_with_yes)
-        return result
+    # rather than storing each passenger's answers and combining them later, we combine them as we read them:
+    # starting with every question, a bitwise AND only keeps the questions that are in every passenger's answers
+    everyone_answered_yes_to = ALL_QUESTIONS
+    for line in lines:
+        everyone_answered_yes_to &= build_answer_bitmask(line)
 
+    return AnswerGroup(
+        questions_everyone_answered_yes_to=everyone_answered_yes_to,
+    )
 
-def load_answers_from_file(f: IO) -> List[AnswerGroup]:
-    """load answers from the puzzle input"""
 
-    groups = []
+def load_answers_from_file(f: BinaryIO) -> Iterator[AnswerGroup]:
+    """load answers from the puzzle input, which must be opened in binary mode, yielding each group as it's read"""
 
-    individual_answers = []
-    for line in f:
+    # the file is read in one go, and splitlines copes with both '\n' and '\r\n' line endings
+    passenger_lines: List[bytes] = []
+    for line in f.read().splitlines():
         # if we encounter a blank line and have data, this is the end of a group, so record it
-        if not line.strip() and individual_answers:
-            groups.append(AnswerGroup(
-                passengers=individual_answers,
-            ))
-            individual_answers = []
+        if not line.strip():
+            if passenger_lines:
+                yield build_answer_group(passenger_lines)
+                passenger_lines = []
             continue
 
-        # otherwise, record all the answers to which an individual responded yes
-        # and record that individual
-        individual_answers.append(IndividualAnswers(
-            questions_answered_with_yes=set(letter for letter in line if letter in string.ascii_lowercase)
-        ))
+        passenger_lines.append(line)
 
-    # if we get to the end and have values in our set, then there's a group that wasn't followed
-    # by a final blank line, so record the individuals from that group
-    if individual_answers:
-        groups.append(AnswerGroup(
-            passengers=individual_answers,
-        ))
-
-    return groups
+    # if we get to the end and have lines left over, then there's a group that wasn't followed by a final blank line
+    if passenger_lines:
+        yield build_answer_group(passenger_lines)
 
 
 def main():
     # load the answers from the input file
-    with open('input/day6.txt') as f:
-        answer_groups = load_answers_from_file(f)
+    with open('input/day6.txt', 'rb') as f:
+        # total the number of questions in each group that everyone answered yes to, as we read each group in,
+        # rather than loading every group first and going back over them all afterwards
+        total_answered_with_yes = 0
+        for group in load_answers_from_file(f):
+            everyone_answered_yes_to = group.questions_everyone_answered_yes_to
+            answered_by_everyone_count = count_bits(everyone_answered_yes_to)
+            print(f"- '{questions_in_bitmask(everyone_answered_yes_to)}' ({answered_by_everyone_count})")
 
-    for group in answer_groups:
-        print(f"- '{''.join(group.questions_everyone_answered_yes_to())}' ({len(group.questions_everyone_answered_yes_to())})")
+            total_answered_with_yes += answered_by_everyone_count
 
-    # total the number of questions in each group that everyone answered yes to
-    total_answered_with_yes = sum(
-        len(group.questions_everyone_answered_yes_to())
-        for group in answer_groups
-    )
     print(f"total questions answered with yes: {total_answered_with_yes}")
 
 
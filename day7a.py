@@ -1,6 +1,8 @@
-from typing import IO, Dict, Optional
+from collections import defaultdict, deque
+from typing import IO, Dict, Optional, Set, Tuple
 from dataclasses import dataclass
 import re
+import sys
 
 
 @dataclass
@@ -8,12 +10,16 @@ class BagContentRule:
     """rule indicating, for a bag of a given colour, how many bags of other colours it can contain"""
 
     bag_colour: str
-    can_contain: Dict[str, int]
+    # pairs of the colour of each bag it can contain, and how many of that bag it can contain - a bag only contains a
+    # handful of other bags, so a tuple of pairs is smaller and quicker to walk through than a dictionary
+    can_contain: Tuple[Tuple[str, int], ...]
 
 
-# rule to match an optionally numbered bag colour
+# what separates the outer bag colour from the description of what it can contain
+BAG_CONTENT_SEPARATOR = ' bags contain '
+# rule to match a numbered bag colour in the description of what a bag can contain
 BAG_CONTENT_RULE_REGEX = re.compile(
-    r'((\d+)\s+)?(\w+\s+\w+)\s*bags?'
+    r'(\d+) (\w+ \w+) bags?'
 )
 
 
@@ -21,31 +27,24 @@ def parse_bag_content_rule_file(f: IO) -> Dict[str, BagContentRule]:
     """loads bag content rules from a file"""
 
     def parse_line(line) -> Optional[BagContentRule]:
-        matches = BAG_CONTENT_RULE_REGEX.findall(line)
+        # the outer bag colour comes before the separator, and what it can contain comes after
+        bag_colour, separator, contents = line.partition(BAG_CONTENT_SEPARATOR)
 
-        # if there aren't at least two matches (the outer bag colour, and at least one contains or 'no bags')
-        # then this is some kind of invalid line!
-        if len(matches) < 2:
+        # if there's no separator then this is some kind of invalid line!
+        if not separator:
             return None
 
-        # the first match is the outer bag colour, it has no count associated with it
-        _, _, bag_colour = matches[0]
-        # if the next match is no other, then this bag can not contain any other bags
-        if matches[1][2] == 'no other':
-            can_contain = {}
-        # otherwise we can now determine what coloured bags this can contain
-        else:
-            # create a dictionary
-            can_contain = {
-                # map the colour of the contained bag to the number of times it may be stored in the outer bag
-                match[2]: int(match[1])
-                # for each match in the list of matches, skipping the first match (as that's the outer bag)
-                for match in matches[1:]
-            }
-
+        # we intern the colours (so every copy of the same colour is the same string object) which makes the
+        # dictionary lookups using them later on quicker
         return BagContentRule(
-            bag_colour=bag_colour,
-            can_contain=can_contain,
+            bag_colour=sys.intern(bag_colour),
+            # if the bag contains "no other bags" then there won't be any matches, and the tuple will be empty
+            can_contain=tuple(
+                # pair the colour of the contained bag with the number of times it may be stored in the outer bag
+                (sys.intern(match[2]), int(match[1]))
+                # for each numbered bag colour after the separator
+                for match in BAG_CONTENT_RULE_REGEX.finditer(contents)
+            ),
         )
 
     # map each rule to the outer bag colour
@@ -59,28 +58,37 @@ def parse_bag_content_rule_file(f: IO) -> Dict[str, BagContentRule]:
     }
 
 
-def can_bag_contain(rules: Dict[str, BagContentRule], outer_bag_colour: str, colour_of_bag_to_store: str) -> bool:
-    """determine whether, given a ruleset, a bag of a given colour can be stored in an outer bag of a given colour"""
+def build_contained_by_map(rules: Dict[str, BagContentRule]) -> Dict[str, Set[str]]:
+    """turn the rules around, to map each bag colour to the colours of the bags that can directly contain it"""
+
+    contained_by = defaultdict(set)
+    for rule in rules.values():
+        for inner_bag_colour, _ in rule.can_contain:
+            contained_by[inner_bag_colour].add(rule.bag_colour)
+    return contained_by
+
 
-    # try and get the rules associated with the outer bag
-    rule_for_outer_bag = rules.get(outer_bag_colour)
-    if not rule_for_outer_bag:
-        raise Exception(f"invalid bag colour: '{outer_bag_colour}'")
+def bags_that_can_contain(rules: Dict[str, BagContentRule], colour_of_bag_to_store: str) -> Set[str]:
+    """determine, given a ruleset, the colours of all the bags that can directly or indirectly store a given bag"""
 
-    # if this bag is directly capable of storing the bag to store, we're done!
-    if colour_of_bag_to_store in rule_for_outer_bag.can_contain:
-        return True
+    # rather than asking every bag whether it can (eventually) store our bag, which means exploring the same inner
+    # bags over and over again, we work outwards from our bag: we find the bags that can store it directly, then the
+    # bags that can store *those* directly, and so on - visiting each bag colour at most once
+    contained_by = build_contained_by_map(rules)
 
-    # otherwise, see if we can store the bag indirectly in one of the bags we can contain
-    for bag_colour in rule_for_outer_bag.can_contain:
-        # here we utilise recursion to test whether we can store the target bag in this inner bag, or any of
-        # the bags that are inside that one! if any can, we're done, because we indirectly can store the bag!
-        if can_bag_contain(rules, bag_colour, colour_of_bag_to_store):
-            return True
+    # the bags we've found that can store our bag
+    found = set()
+    # the bags whose outer bags we still need to look at
+    to_visit = deque([colour_of_bag_to_store])
+    while to_visit:
+        bag_colour = to_visit.popleft()
+        for outer_bag_colour in contained_by.get(bag_colour, ()):
+            # if we've already found this bag, we've already queued up its outer bags too, so skip it
+            if outer_bag_colour not in found:
+                found.add(outer_bag_colour)
+                to_visit.append(outer_bag_colour)
 
-    # if we cannot store the bag directly, and if we can't store it indirectly inside one of our contained
-    # bags, then we cannot store the target bag
-    return False
+    return found
 
 
 def main():
@@ -92,15 +100,7 @@ def main():
     our_bag_colour = 'shiny gold'
 
     # count how many bags could contain our bag
-    how_many_can_store_our_bag = len([
-        # it doesn't matter what we store here, we only need the length of the list, but:
-        # record the colour of the bag
-        bag_colour
-        # for every bag colour described in the rules
-        for bag_colour in bag_content_rules
-        # if it could, directly or indirectly, contain our bag colour
-        if can_bag_contain(bag_content_rules, bag_colour, our_bag_colour)
-    ])
+    how_many_can_store_our_bag = len(bags_that_can_contain(bag_content_rules, our_bag_colour))
     print("there are {} bags that could, directly or indirectly, store our {} bag".format(
         how_many_can_store_our_bag,
         our_bag_colour,
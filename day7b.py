@@ -1,6 +1,7 @@
-from typing import IO, Dict, Optional
+from typing import IO, Dict, Optional, Tuple
 from dataclasses import dataclass
 import re
+import sys
 
 
 @dataclass
@@ -8,12 +9,16 @@ class BagContentRule:
     """rule indicating, for a bag of a given colour, how many bags of other colours it can contain"""
 
     bag_colour: str
-    can_contain: Dict[str, int]
+    # pairs of the colour of each bag it can contain, and how many of that bag it can contain - a bag only contains a
+    # handful of other bags, so a tuple of pairs is smaller and quicker to walk through than a dictionary
+    can_contain: Tuple[Tuple[str, int], ...]
 
 
-# rule to match an optionally numbered bag colour
+# what separates the outer bag colour from the description of what it can contain
+BAG_CONTENT_SEPARATOR = ' bags contain '
+# rule to match a numbered bag colour in the description of what a bag can contain
 BAG_CONTENT_RULE_REGEX = re.compile(
-    r'((\d+)\s+)?(\w+\s+\w+)\s*bags?'
+    r'(\d+) (\w+ \w+) bags?'
 )
 
 
@@ -21,31 +26,24 @@ def parse_bag_content_rule_file(f: IO) -> Dict[str, BagContentRule]:
     """loads bag content rules from a file"""
 
     def parse_line(line) -> Optional[BagContentRule]:
-        matches = BAG_CONTENT_RULE_REGEX.findall(line)
+        # the outer bag colour comes before the separator, and what it can contain comes after
+        bag_colour, separator, contents = line.partition(BAG_CONTENT_SEPARATOR)
 
-        # if there aren't at least two matches (the outer bag colour, and at least one contains or 'no bags')
-        # then this is some kind of invalid line!
-        if len(matches) < 2:
+        # if there's no separator then this is some kind of invalid line!
+        if not separator:
             return None
 
-        # the first match is the outer bag colour, it has no count associated with it
-        _, _, bag_colour = matches[0]
-        # if the next match is no other, then this bag can not contain any other bags
-        if matches[1][2] == 'no other':
-            can_contain = {}
-        # otherwise we can now determine what coloured bags this can contain
-        else:
-            # create a dictionary
-            can_contain = {
-                # map the colour of the contained bag to the number of times it may be stored in the outer bag
-                match[2]: int(match[1])
-                # for each match in the list of matches, skipping the first match (as that's the outer bag)
-                for match in matches[1:]
-            }
-
+        # we intern the colours (so every copy of the same colour is the same string object) which makes the
+        # dictionary lookups using them later on quicker
         return BagContentRule(
-            bag_colour=bag_colour,
-            can_contain=can_contain,
+            bag_colour=sys.intern(bag_colour),
+            # if the bag contains "no other bags" then there won't be any matches, and the tuple will be empty
+            can_contain=tuple(
+                # pair the colour of the contained bag with the number of times it may be stored in the outer bag
+                (sys.intern(match[2]), int(match[1]))
+                # for each numbered bag colour after the separator
+                for match in BAG_CONTENT_RULE_REGEX.finditer(contents)
+            ),
         )
 
     # map each rule to the outer bag colour
@@ -62,23 +60,37 @@ def parse_bag_content_rule_file(f: IO) -> Dict[str, BagContentRule]:
 def bags_contained_by(rules: Dict[str, BagContentRule], outer_bag_colour: str) -> int:
     """determine how many bags are contained within a given bag colour based on the given rules"""
 
-    # try and get the rules associated with the bag colour
-    rule_for_outer_bag = rules.get(outer_bag_colour)
-    if not rule_for_outer_bag:
-        raise Exception(f"invalid bag colour: '{outer_bag_colour}'")
-
-    bags_stored = 0
+    # remember how many bags are inside each bag colour once we've counted it, so that a bag which turns up inside
+    # lots of other bags is only counted the first time we see it
+    bags_stored: Dict[str, int] = {}
+    # the bags we're part way through counting, so we can spot a bag that (eventually) contains itself
+    being_counted = set()
+
+    def count(bag_colour: str) -> int:
+        # if we've already counted this bag, we're done!
+        if bag_colour in bags_stored:
+            return bags_stored[bag_colour]
+
+        # try and get the rules associated with the bag colour
+        rule = rules.get(bag_colour)
+        if not rule:
+            raise Exception(f"invalid bag colour: '{bag_colour}'")
+        if bag_colour in being_counted:
+            raise Exception(f"bag colour '{bag_colour}' contains itself")
+
+        being_counted.add(bag_colour)
+        # here we utilise recursion to count how many bags are inside each bag we contain, noting that we can store
+        # 'count' bags of that colour directly, plus 'count' times however many bags it contains
+        total = sum(
+            inner_count * (1 + count(inner_bag_colour))
+            for inner_bag_colour, inner_count in rule.can_contain
+        )
+        being_counted.remove(bag_colour)
 
-    # tally up how many bags are stored inside the bags inside us
-    for bag_colour, count in rule_for_outer_bag.can_contain.items():
-        # record how many of this bag colour we can store directly
-        bags_stored += count
-        # here we utilise recursion to count how many bags are inside this bag,
-        # noting that we can store 'count' bags of this colour, so however many bags
-        # it contain, we can store 'count' times that!
-        bags_stored += bags_contained_by(rules, bag_colour) * count
+        bags_stored[bag_colour] = total
+        return total
 
-    return bags_stored
+    return count(outer_bag_colour)
 
 
 def main():
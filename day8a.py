@@ -1,23 +1,21 @@
-from dataclasses import dataclass
-from typing import List
-import enum
+from typing import IO, List, Tuple
 
 
-@enum.unique
-class Opcode(enum.Enum):
-    """distinguishes which operation an instruction should perform"""
+# which operation an instruction should perform
+#
+# these are plain numbers (rather than an enum) so that a program can be stored as a list of opcodes alongside a list
+# of arguments, rather than a list of instruction objects, and so that comparing them is as quick as comparing any
+# other numbers
+NO_OPERATION = 0
+ACCUMULATE = 1
+JUMP = 2
 
-    Accumulate = enum.auto()
-    Jump = enum.auto()
-    NoOperation = enum.auto()
-
-
-@dataclass
-class Instruction:
-    """information needed to perform a single operation"""
-
-    opcode: Opcode
-    argument: int
+# use a dictionary to map the text mneumonics for instructions to their opcodes
+OPCODE_LOOKUP = {
+    'nop': NO_OPERATION,
+    'acc': ACCUMULATE,
+    'jmp': JUMP,
+}
 
 
 class CPU:
@@ -30,49 +28,73 @@ class CPU:
         self.accumulator = 0
         # we'll execute the first instruction in memory first
         self.instruction_pointer = 0
-        # the computer has a program in memory, though it starts uninitialised
-        self.program_memory: List[Instruction] = []
+        # the computer has a program in memory, though it starts uninitialised - we only keep the opcode of each
+        # instruction, as the arguments are folded into the effect lists below when the program is loaded
+        self.opcodes: List[int] = []
+        # rather than deciding what each opcode does every time we execute an instruction, we work out up front how
+        # much each instruction adds to the accumulator, and how far each instruction moves the instruction pointer,
+        # so that executing an instruction is the same two additions whatever it is
+        self.accumulate_by: List[int] = []
+        self.move_by: List[int] = []
+
+    def set_program_memory(self, opcodes: List[int], arguments: List[int]):
+        """initialise the processor's program memory"""
 
-    @property
-    def is_complete(self):
-        return self.instruction_pointer >= len(self.program_memory)
+        self.opcodes = opcodes
+        self.accumulate_by, self.move_by = build_instruction_effects(opcodes, arguments)
 
-    def set_program_memory(self, program: List[Instruction]):
-        """initialise the processor's program memory"""
+    def run_until_halt_or_loop(self):
+        """executes instructions until the program either halts or is about to execute an instruction a second time"""
+
+        # everything is pulled out into local variables first, so that each step doesn't have to look anything up on
+        # the CPU object
+        program_length = len(self.opcodes)
+        accumulator = self.accumulator
+        instruction_pointer = self.instruction_pointer
+        accumulate_by = self.accumulate_by
+        move_by = self.move_by
 
-        self.program_memory = program
+        # keep track of which instructions we've executed, with a flag per instruction in the program
+        instructions_executed = bytearray(program_length)
+        # keep running instructions, until we run off the end of memory or try to run one for a second time
+        while instruction_pointer < program_length and not instructions_executed[instruction_pointer]:
+            # record the instruction we're about to execute
+            instructions_executed[instruction_pointer] = 1
 
-    def execute_instruction(self):
-        """executes a single instruction"""
+            accumulator += accumulate_by[instruction_pointer]
+            instruction_pointer += move_by[instruction_pointer]
 
-        if self.is_complete:
-            # when we run off the end of memory, halt
-            return
+        # store the results back in the CPU
+        self.accumulator = accumulator
+        self.instruction_pointer = instruction_pointer
 
-        # fetch the next instruction to execute
-        instruction = self.program_memory[self.instruction_pointer]
-        # most instructions simply move onto the next instruction upon completion, so let's default to
-        # considering the next instruction as the one we'll do next, individual operations can override this
-        next_instruction_pointer = self.instruction_pointer + 1
 
-        if instruction.opcode == Opcode.NoOperation:
+def build_instruction_effects(opcodes: List[int], arguments: List[int]) -> Tuple[List[int], List[int]]:
+    """works out how much each instruction adds to the accumulator, and how far it moves the instruction pointer"""
+
+    accumulate_by = []
+    move_by = []
+    for index, (opcode, argument) in enumerate(zip(opcodes, arguments)):
+        if opcode == NO_OPERATION:
             # nop operations do nothing! :)
-            pass
-        elif instruction.opcode == Opcode.Jump:
+            accumulate_by.append(0)
+            move_by.append(1)
+        elif opcode == JUMP:
             # jmp operations override the next instruction to execute
-            next_instruction_pointer = self.instruction_pointer + instruction.argument
-        elif instruction.opcode == Opcode.Accumulate:
+            accumulate_by.append(0)
+            move_by.append(argument)
+        elif opcode == ACCUMULATE:
             # acc operations add their argument to the accumulator
-            self.accumulator += instruction.argument
+            accumulate_by.append(argument)
+            move_by.append(1)
         else:
-            raise Exception(f"failed to execute unknown instruction {instruction.opcode} at {self.instruction_pointer}")
+            raise Exception(f"failed to execute unknown instruction {opcode} at {index}")
 
-        # record which instruction to record next
-        self.instruction_pointer = next_instruction_pointer
+    return accumulate_by, move_by
 
 
-def load_instruction(line: str) -> Instruction:
-    """decode an instruction from a line of text from the input"""
+def load_instruction(line: str) -> Tuple[int, int]:
+    """decode an instruction from a line of text from the input, into its opcode and argument"""
 
     # start by splitting the line by whitespace, to separate the opcode and argument
     parts = line.split()
@@ -82,44 +104,37 @@ def load_instruction(line: str) -> Instruction:
     # we've confirmed that we split it into two parts, so let's give those parts nicer names to work with
     opcode_mneumonic, argument = parts
 
-    # use a dictionary to map the text mneumonics for instructions to an enumeration of constant values
-    opcode_lookup = {
-        'nop': Opcode.NoOperation,
-        'acc': Opcode.Accumulate,
-        'jmp': Opcode.Jump,
-    }
-
-    if opcode_mneumonic not in opcode_lookup:
+    if opcode_mneumonic not in OPCODE_LOOKUP:
         raise Exception(f"unknown instruction '{opcode_mneumonic}'")
 
     # return the finalised instruction
-    return Instruction(
-        opcode=opcode_lookup[opcode_mneumonic],
-        argument=int(argument),
-    )
+    return OPCODE_LOOKUP[opcode_mneumonic], int(argument)
+
+
+def load_program(f: IO) -> Tuple[List[int], List[int]]:
+    """load a program from the input, as a list of the opcodes and a list of the arguments of each instruction"""
+
+    opcodes = []
+    arguments = []
+    for line in f:
+        opcode, argument = load_instruction(line)
+        opcodes.append(opcode)
+        arguments.append(argument)
+    return opcodes, arguments
 
 
 def main():
     # load the boot program from the input file
     with open('input/day8.txt') as f:
-        boot_program = [
-            load_instruction(line)
-            for line in f
-        ]
+        boot_opcodes, boot_arguments = load_program(f)
 
     # initialise the CPU
     cpu = CPU()
     # load the boot program into the processor
-    cpu.set_program_memory(boot_program)
+    cpu.set_program_memory(boot_opcodes, boot_arguments)
 
-    # keep track of which instructions we've executed
-    instructions_executed = set()
     # keep running instructions, until you try to run one for a second time
-    while not cpu.is_complete and cpu.instruction_pointer not in instructions_executed:
-        # record the instruction we're about to execute
-        instructions_executed.add(cpu.instruction_pointer)
-
-        cpu.execute_instruction()
+    cpu.run_until_halt_or_loop()
 
     print(f"just before the program executes an instruction for the second time, the accumulator is: {cpu.accumulator}")
 
@@ -1,23 +1,33 @@
-from dataclasses import dataclass
-from typing import List
-import enum
-
-
-@enum.unique
-class Opcode(enum.Enum):
-    """distinguishes which operation an instruction should perform"""
-
-    Accumulate = enum.auto()
-    Jump = enum.auto()
-    NoOperation = enum.auto()
-
-
-@dataclass
-class Instruction:
-    """information needed to perform a single operation"""
-
-    opcode: Opcode
-    argument: int
+from collections import defaultdict, deque
+from typing import IO, List, Optional, Set, Tuple
+
+
+# which operation an instruction should perform
+#
+# these are plain numbers (rather than an enum) so that a program can be stored as a list of opcodes alongside a list
+# of arguments, rather than a list of instruction objects, and so that comparing them is as quick as comparing any
+# other numbers
+NO_OPERATION = 0
+ACCUMULATE = 1
+JUMP = 2
+
+# use a dictionary to map the text mneumonics for instructions to their opcodes
+OPCODE_LOOKUP = {
+    'nop': NO_OPERATION,
+    'acc': ACCUMULATE,
+    'jmp': JUMP,
+}
+# and the reverse, for displaying opcodes
+OPCODE_MNEUMONICS = {
+    opcode: mneumonic
+    for mneumonic, opcode in OPCODE_LOOKUP.items()
+}
+
+# which kinds of instructions we can try replacing, and with what
+SWAP_MAP = {
+    JUMP: NO_OPERATION,
+    NO_OPERATION: JUMP,
+}
 
 
 class CPU:
@@ -30,54 +40,95 @@ class CPU:
         self.accumulator = 0
         # we'll execute the first instruction in memory first
         self.instruction_pointer = 0
-        # the computer has a program in memory, though it starts uninitialised
-        self.program_memory: List[Instruction] = []
+        # the computer has a program in memory, though it starts uninitialised - the program is stored as two lists,
+        # the opcode of each instruction and the argument of each instruction
+        self.opcodes: List[int] = []
+        self.arguments: List[int] = []
+        # rather than deciding what each opcode does every time we execute an instruction, we work out up front how
+        # much each instruction adds to the accumulator, and how far each instruction moves the instruction pointer,
+        # so that executing an instruction is the same two additions whatever it is
+        self.accumulate_by: List[int] = []
+        self.move_by: List[int] = []
         # track the number of operations performed
         self.cycles = 0
 
     @property
     def is_complete(self):
-        return self.instruction_pointer >= len(self.program_memory)
+        return self.instruction_pointer >= len(self.opcodes)
 
-    def set_program_memory(self, program: List[Instruction]):
+    def set_program_memory(self, opcodes: List[int], arguments: List[int]):
         """initialise the processor's program memory"""
 
-        self.program_memory = program
-
-    def execute_instruction(self):
-        """executes a single instruction"""
-
-        if self.is_complete:
-            # when we run off the end of memory, halt
-            return
-
-        # fetch the next instruction to execute
-        instruction = self.program_memory[self.instruction_pointer]
-        # most instructions simply move onto the next instruction upon completion, so let's default to
-        # considering the next instruction as the one we'll do next, individual operations can override this
-        next_instruction_pointer = self.instruction_pointer + 1
-
-        if instruction.opcode == Opcode.NoOperation:
-            # nop operations do nothing! :)
-            pass
-        elif instruction.opcode == Opcode.Jump:
-            # jmp operations override the next instruction to execute
-            next_instruction_pointer = self.instruction_pointer + instruction.argument
-        elif instruction.opcode == Opcode.Accumulate:
-            # acc operations add their argument to the accumulator
-            self.accumulator += instruction.argument
-        else:
-            raise Exception(f"failed to execute unknown instruction {instruction.opcode} at {self.instruction_pointer}")
+        self.opcodes = opcodes
+        self.arguments = arguments
+        self.accumulate_by, self.move_by = build_instruction_effects(opcodes, arguments)
+
+    def set_opcode(self, index: int, opcode: int):
+        """replaces the opcode of a single instruction in program memory"""
+
+        self.opcodes[index] = opcode
+        # only this instruction's effects change, so there's no need to work them all out again
+        self.accumulate_by[index], self.move_by[index] = instruction_effect(index, opcode, self.arguments[index])
+
+    def run_until_halt_or_loop(self):
+        """executes instructions until the program either halts or is about to execute an instruction a second time"""
+
+        # everything is pulled out into local variables first, so that each step doesn't have to look anything up on
+        # the CPU object
+        program_length = len(self.opcodes)
+        accumulator = self.accumulator
+        instruction_pointer = self.instruction_pointer
+        accumulate_by = self.accumulate_by
+        move_by = self.move_by
+
+        # keep track of which instructions we've executed, with a flag per instruction in the program
+        instructions_executed = bytearray(program_length)
+        # keep running instructions, until we run off the end of memory or try to run one for a second time
+        while instruction_pointer < program_length and not instructions_executed[instruction_pointer]:
+            # record the instruction we're about to execute
+            instructions_executed[instruction_pointer] = 1
+
+            accumulator += accumulate_by[instruction_pointer]
+            instruction_pointer += move_by[instruction_pointer]
+
+        # store the results back in the CPU
+        self.accumulator = accumulator
+        self.instruction_pointer = instruction_pointer
+        # we executed every instruction we flagged exactly once
+        self.cycles += instructions_executed.count(1)
+
+
+def instruction_effect(index: int, opcode: int, argument: int) -> Tuple[int, int]:
+    """works out how much an instruction adds to the accumulator, and how far it moves the instruction pointer"""
+
+    if opcode == NO_OPERATION:
+        # nop operations do nothing! :)
+        return 0, 1
+    elif opcode == JUMP:
+        # jmp operations override the next instruction to execute
+        return 0, argument
+    elif opcode == ACCUMULATE:
+        # acc operations add their argument to the accumulator
+        return argument, 1
+    else:
+        raise Exception(f"failed to execute unknown instruction {opcode} at {index}")
 
-        # record which instruction to record next
-        self.instruction_pointer = next_instruction_pointer
 
-        # track this completed operation
-        self.cycles += 1
+def build_instruction_effects(opcodes: List[int], arguments: List[int]) -> Tuple[List[int], List[int]]:
+    """works out how much each instruction adds to the accumulator, and how far it moves the instruction pointer"""
 
+    accumulate_by = []
+    move_by = []
+    for index, (opcode, argument) in enumerate(zip(opcodes, arguments)):
+        accumulate, move = instruction_effect(index, opcode, argument)
+        accumulate_by.append(accumulate)
+        move_by.append(move)
 
-def load_instruction(line: str) -> Instruction:
-    """decode an instruction from a line of text from the input"""
+    return accumulate_by, move_by
+
+
+def load_instruction(line: str) -> Tuple[int, int]:
+    """decode an instruction from a line of text from the input, into its opcode and argument"""
 
     # start by splitting the line by whitespace, to separate the opcode and argument
     parts = line.split()
@@ -87,90 +138,114 @@ def load_instruction(line: str) -> Instruction:
     # we've confirmed that we split it into two parts, so let's give those parts nicer names to work with
     opcode_mneumonic, argument = parts
 
-    # use a dictionary to map the text mneumonics for instructions to an enumeration of constant values
-    opcode_lookup = {
-        'nop': Opcode.NoOperation,
-        'acc': Opcode.Accumulate,
-        'jmp': Opcode.Jump,
-    }
-
-    if opcode_mneumonic not in opcode_lookup:
+    if opcode_mneumonic not in OPCODE_LOOKUP:
         raise Exception(f"unknown instruction '{opcode_mneumonic}'")
 
     # return the finalised instruction
-    return Instruction(
-        opcode=opcode_lookup[opcode_mneumonic],
-        argument=int(argument),
-    )
-
-
-def run_until_halt_or_loop(program: List[Instruction]) -> CPU:
-    """creates a CPU and executes the provided program on it until it either exits gracefully or starts repeating"""
-
-    # initialise the CPU
-    cpu = CPU()
-    # load the boot program into the processor
-    cpu.set_program_memory(program)
+    return OPCODE_LOOKUP[opcode_mneumonic], int(argument)
+
+
+def load_program(f: IO) -> Tuple[List[int], List[int]]:
+    """load a program from the input, as a list of the opcodes and a list of the arguments of each instruction"""
+
+    opcodes = []
+    arguments = []
+    for line in f:
+        opcode, argument = load_instruction(line)
+        opcodes.append(opcode)
+        arguments.append(argument)
+    return opcodes, arguments
+
+
+def instructions_that_reach_halt(opcodes: List[int], arguments: List[int]) -> Set[int]:
+    """finds every instruction which, if the unmodified program got to it, would go on to run off the end"""
+
+    program_length = len(opcodes)
+
+    # for every instruction, record which instructions lead straight to it - anything that would go past the end of
+    # the program is treated as leading to the end of the program
+    comes_from = defaultdict(list)
+    for index, (opcode, argument) in enumerate(zip(opcodes, arguments)):
+        next_instruction_pointer = index + argument if opcode == JUMP else index + 1
+        comes_from[min(next_instruction_pointer, program_length)].append(index)
+
+    # now work backwards from the end of the program, finding everything that (eventually) leads there
+    reach_halt = set()
+    to_visit = deque([program_length])
+    while to_visit:
+        for previous_instruction_pointer in comes_from[to_visit.popleft()]:
+            if previous_instruction_pointer not in reach_halt:
+                reach_halt.add(previous_instruction_pointer)
+                to_visit.append(previous_instruction_pointer)
+
+    return reach_halt
+
+
+def find_instruction_to_swap(opcodes: List[int], arguments: List[int]) -> Optional[int]:
+    """find the instruction that, when swapped between jmp and nop, lets the program run off the end"""
+
+    # rather than trying every possible swap and running the whole program each time, notice that:
+    #   1) the instruction we swap must be one the program actually runs, or the swap would make no difference, and
+    #      up until we reach it, the program runs exactly the same as it does now
+    #   2) after we reach it, the program must go somewhere that, left as it is, runs off the end of the program
+    # so we just follow the program as it is, and stop at the first swappable instruction which, once swapped,
+    # would take us somewhere that reaches the end of the program
+    program_length = len(opcodes)
+    reach_halt = instructions_that_reach_halt(opcodes, arguments)
+
+    instruction_pointer = 0
+    instructions_executed = bytearray(program_length)
+    while instruction_pointer < program_length and not instructions_executed[instruction_pointer]:
+        instructions_executed[instruction_pointer] = 1
+        opcode = opcodes[instruction_pointer]
+
+        # work out where this instruction goes now, and where it would go if it was swapped
+        if opcode == JUMP:
+            swapped_instruction_pointer = instruction_pointer + 1
+            next_instruction_pointer = instruction_pointer + arguments[instruction_pointer]
+        else:
+            swapped_instruction_pointer = instruction_pointer + arguments[instruction_pointer]
+            next_instruction_pointer = instruction_pointer + 1
 
-    # keep track of which instructions we've executed
-    instructions_executed = set()
-    # keep running instructions, until you try to run one for a second time
-    while not cpu.is_complete and cpu.instruction_pointer not in instructions_executed:
-        # record the instruction we're about to execute
-        instructions_executed.add(cpu.instruction_pointer)
+        if opcode in SWAP_MAP and (swapped_instruction_pointer >= program_length
+                                   or swapped_instruction_pointer in reach_halt):
+            return instruction_pointer
 
-        cpu.execute_instruction()
+        instruction_pointer = next_instruction_pointer
 
-    return cpu
+    # either the program already halts, or no single swap can fix it
+    return None
 
 
 def main():
     # load the boot program from the input file
     with open('input/day8.txt') as f:
-        boot_program = [
-            load_instruction(line)
-            for line in f
-        ]
-
-    # which kinds of instructions to try replacing, and with what
-    swap_map = {
-        Opcode.Jump: Opcode.NoOperation,
-        Opcode.NoOperation: Opcode.Jump,
-    }
-    # track messages describing possible solutions
-    solutions = []
-    # consider every instruction in the entire program for whether swapping it will fix it
-    for index, i in enumerate(boot_program):
-        # if this instruction isn't one of the ones we can swap, skip it
-        if i.opcode not in swap_map:
-            continue
-
-        # copy the boot program
-        test_program = boot_program[:]
-        # replace the current instruction we're interested in testing with an identical instruction,
-        # but with the opcode swapped
-        test_program[index] = Instruction(
-            opcode=swap_map[i.opcode],
-            argument=i.argument,
-        )
-
-        # display what we're trying
-        print(f"changing {index} {i.opcode} to {test_program[index].opcode}")
-
-        # run the program until it either halts or starts repeating itself
-        cpu_on_exit = run_until_halt_or_loop(test_program)
-
-        # if the CPU had halted, then it completed "gracefully", by hitting the end of the program
-        if cpu_on_exit.is_complete:
-            # record the solution so we can print it at the end of the program, after all the spammy output
-            message = f"possible solution, when the cpu halted the accumulator was {cpu_on_exit.accumulator}"
-            solutions.append(message)
-        else:
-            print(f"started looping after {cpu_on_exit.cycles} cycles")
+        boot_opcodes, boot_arguments = load_program(f)
+
+    # find which instruction needs swapping to fix the program
+    index = find_instruction_to_swap(boot_opcodes, boot_arguments)
+    if index is None:
+        raise Exception("could not find an instruction to swap that lets the program halt")
+
+    # initialise the CPU, and load the boot program into the processor
+    cpu = CPU()
+    cpu.set_program_memory(boot_opcodes, boot_arguments)
+
+    # swap the instruction's opcode in place, rather than copying the whole program
+    original_opcode = boot_opcodes[index]
+    cpu.set_opcode(index, SWAP_MAP[original_opcode])
+
+    # display what we're changing
+    print(f"changing {index} {OPCODE_MNEUMONICS[original_opcode]} to {OPCODE_MNEUMONICS[cpu.opcodes[index]]}")
+
+    # run the program until it either halts or starts repeating itself
+    cpu.run_until_halt_or_loop()
+
+    # if the CPU had halted, then it completed "gracefully", by hitting the end of the program
+    if not cpu.is_complete:
+        raise Exception(f"program started looping after {cpu.cycles} cycles, even with the swap")
 
-    # show all the possible solutions
-    for message in solutions:
-        print(message)
+    print(f"solution, when the cpu halted the accumulator was {cpu.accumulator}")
 
 
 if __name__ == '__main__':
@@ -1,11 +1,14 @@
-from typing import Iterator, List
+from collections import deque
+from itertools import islice
+from typing import Deque, Iterable, Iterator
 
 
-def sliding_window_over(collection: Iterator[int], window_size: int) -> Iterator[List[int]]:
+def sliding_window_over(collection: Iterable[int], window_size: int) -> Iterator[Deque[int]]:
     """slides a window of a specified size across a collection, yielding the values within that window"""
 
-    # values in the window
-    window = []
+    # values in the window - a deque with a maximum length automatically drops the oldest value off the front when
+    # a new one is added to the back, which keeps it at 'window_size' without having to copy the window every step
+    window: Deque[int] = deque(maxlen=window_size)
 
     # go through the entire collection to build up the window and yield it when full
     for value in collection:
@@ -15,25 +18,23 @@ def sliding_window_over(collection: Iterator[int], window_size: int) -> Iterator
         if len(window) < window_size:
             continue
 
-        # if the window has too many values in it, remove the oldest values, to keep it at 'window_size'
-        if len(window) > window_size:
-            window = window[-window_size:]
-
         # yield the numbers in the current window so the caller can examine it
         # note that this allows the caller to examine the value _before_ we continue this function!
+        # also note that this is the same window every time, so the caller shouldn't hold onto it
         yield window
 
 
-def can_sum_to(terms: List[int], target: int) -> bool:
+def can_sum_to(terms: Iterable[int], target: int) -> bool:
     """determines whether a target number can be constructed by pairs of numbers from the list of terms"""
 
-    # for every number
-    for idx, a in enumerate(terms):
-        # compare it to every other number we haven't already tried summing it with
-        for b in terms[idx+1:]:
-            # if the sum of values matches the target, bam, we're done! :)
-            if a + b == target:
-                return True
+    # rather than comparing every number to every other number, we remember the numbers we've already seen: then for
+    # each number we only need to check whether the number it'd need to be paired with is one of them
+    seen = set()
+    for a in terms:
+        # if the other half of the sum is a number we've already seen, bam, we're done! :)
+        if target - a in seen:
+            return True
+        seen.add(a)
 
     # if we found no sums that match the target, we're done
     return False
@@ -42,9 +43,10 @@ def can_sum_to(terms: List[int], target: int) -> bool:
 def main():
     # load the XMAS numbers from the input file
     with open('input/day9.txt') as f:
+        # read the whole file in one go and split it up by whitespace into the numbers
         numbers = [
-            int(line)
-            for line in f
+            int(word)
+            for word in f.read().split()
         ]
 
     # number of numbers that make up the preamble
@@ -54,7 +56,7 @@ def main():
     # look at the numbers in a sliding window
     for window in sliding_window_over(numbers, numbers_to_consider_at_once):
         # split the numbers in the window into the preamble and...
-        preamble = window[:preamble_length]
+        preamble = islice(window, preamble_length)
         # ...the final number that must be a sum of any two numbers in the preamble
         number_to_consider = window[-1]
 
@@ -1,55 +1,50 @@
-from typing import Iterator, List
+from typing import List, Optional
 
 
-def sliding_window_over(collection: Iterator[int], window_size: int) -> Iterator[List[int]]:
-    """slides a window of a specified size across a collection, yielding the values within that window"""
+def find_contiguous_numbers_summing_to(numbers: List[int], target: int) -> Optional[List[int]]:
+    """finds a contiguous group of at least two numbers which sum to the target"""
 
-    # values in the window
-    window = []
+    # rather than trying every size of group at every position, we keep a single group between two positions (start
+    # and end) and keep a running total of it: we grow the group at the end one number at a time, and whenever the
+    # total gets too big we shrink the group from the start until it isn't - because all the numbers are positive,
+    # a group that's too big can only get smaller by dropping numbers from the start
+    #
+    # this means every number is added to the group once and dropped from it at most once
+    total = 0
+    start = 0
+    for end, number in enumerate(numbers):
+        total += number
+        while total > target and start < end:
+            total -= numbers[start]
+            start += 1
 
-    # go through the entire collection to build up the window and yield it when full
-    for value in collection:
-        # add a value into the window
-        window.append(value)
-        # if the window isn't full yet, just skip to the next iteration to continue filling it
-        if len(window) < window_size:
-            continue
+        if total == target and end > start:
+            return numbers[start:end+1]
 
-        # if the window has too many values in it, remove the oldest values, to keep it at 'window_size'
-        if len(window) > window_size:
-            window = window[-window_size:]
-
-        # yield the numbers in the current window so the caller can examine it
-        # note that this allows the caller to examine the value _before_ we continue this function!
-        yield window
+    return None
 
 
 def main():
     # load the XMAS numbers from the input file
     with open('input/day9.txt') as f:
+        # read the whole file in one go and split it up by whitespace into the numbers
         numbers = [
-            int(line)
-            for line in f
+            int(word)
+            for word in f.read().split()
         ]
 
     # the invalid sum that we're trying to find terms to sum up to
     target_number = 70639851
 
-    # try different sizes of number groups, starting at 2 numbers, working up to almost every number in the set
-    for window_size in range(2, len(numbers)-2):
-        print(f"testing for {window_size} sized groups of numbers")
-
-        # for every contiguous group of numbers in the entire set
-        for window in sliding_window_over(numbers, window_size):
-            # try summing all those numbers, and see if they match the target number
-            if sum(window) == target_number:
-                print(f"you can sum {len(window)} numbers to produce {target_number}")
-                biggest, smallest = max(window), min(window)
-                print(f"the largest number is {biggest} and the smallest is {smallest}")
-                print(f"the encryption weakness is the sum of these numbers: {smallest + biggest}")
-
-                # exit the function now we've found a solution
-                return
+    # find the group of numbers that sums to the target number
+    group = find_contiguous_numbers_summing_to(numbers, target_number)
+    if group is None:
+        raise Exception(f"no contiguous group of numbers sums to {target_number}")
+
+    print(f"you can sum {len(group)} numbers to produce {target_number}")
+    biggest, smallest = max(group), min(group)
+    print(f"the largest number is {biggest} and the smallest is {smallest}")
+    print(f"the encryption weakness is the sum of these numbers: {smallest + biggest}")
 
 
 if __name__ == "__main__":